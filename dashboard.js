@@ -0,0 +1,415 @@
+// REO Dashboard page script, served next to index.html.
+// The generated page defines VIRTUALIZE and originalData in an inline script
+// before this one runs; everything else (search, filters, sorting and row
+// rendering) lives here so browsers can cache it across dashboard rebuilds.
+
+const tableBody = document.getElementById('tableBody');
+
+// Filtering and sorting work on row indices: currentRows is an Int32Array of
+// positions in originalData, and every per-row field they need lives in its
+// own flat column array indexed the same way
+const ROW_COUNT = originalData.length;
+let currentRows = new Int32Array(ROW_COUNT);
+for (let i = 0; i < ROW_COUNT; i++) {
+    currentRows[i] = i;
+}
+let sortColumn = -1;
+let sortDirection = 'asc';
+let activeFilter = null;
+
+// Lowercased address and ENS name per row, computed once at load so searching
+// doesn't lowercase every row on every keystroke (they double as sort keys)
+const addressIndex = new Array(ROW_COUNT);
+const ensIndex = new Array(ROW_COUNT);
+const statuses = new Array(ROW_COUNT);
+for (let i = 0; i < ROW_COUNT; i++) {
+    const row = originalData[i];
+    addressIndex[i] = row[0].toLowerCase();
+    ensIndex[i] = row[1].toLowerCase();
+    statuses[i] = row[2];
+}
+
+// Search functionality
+const searchInput = document.getElementById('searchInput');
+const totalCount = document.getElementById('totalCount');
+const filteredCount = document.getElementById('filteredCount');
+
+// Recent search results (term -> Int32Array of matching row indices, in
+// originalData order), so backspacing to an earlier term is a lookup. A term that
+// extends a cached one can only match a subset of its rows, so it scans that
+// result instead of the whole table.
+const SEARCH_CACHE_SIZE = 32;
+const searchCache = new Map();
+
+function searchRows(searchTerm) {
+    const cached = searchCache.get(searchTerm);
+    if (cached) return cached;
+
+    // Start from the longest cached term this one extends, if any
+    let base = null;
+    let baseLength = -1;
+    for (const [term, rows] of searchCache) {
+        if (term.length > baseLength && searchTerm.startsWith(term)) {
+            base = rows;
+            baseLength = term.length;
+        }
+    }
+    const n = base ? base.length : ROW_COUNT;
+
+    // Addresses are "0x" + hex, so an "0x..." term can only match an address at
+    // its very start and startsWith is enough there
+    const prefixSearch = searchTerm.startsWith('0x');
+
+    // Plain indexed loops throughout the filter/sort/render paths: no per-row
+    // callback, and the engine can keep the loop body monomorphic
+    const matches = new Int32Array(n);
+    let count = 0;
+    for (let j = 0; j < n; j++) {
+        const i = base ? base[j] : j;
+        // Address first: every row has one and most searches target it, so the
+        // ENS name (often empty, which fails at once) is only scanned on a miss
+        const matchesAddress = prefixSearch
+            ? addressIndex[i].startsWith(searchTerm)
+            : addressIndex[i].includes(searchTerm);
+        if (matchesAddress || ensIndex[i].includes(searchTerm)) {
+            matches[count++] = i;
+        }
+    }
+    const result = matches.slice(0, count);
+
+    searchCache.set(searchTerm, result);
+    if (searchCache.size > SEARCH_CACHE_SIZE) {
+        searchCache.delete(searchCache.keys().next().value);
+    }
+    return result;
+}
+
+// Apply both search and filter
+function applyFilters() {
+    const rows = searchRows(searchInput.value.toLowerCase());
+
+    // Always build a fresh array: sortTable sorts currentRows in place, and the
+    // cached search results must keep their original order. Without a status
+    // filter that is a plain copy.
+    if (!activeFilter) {
+        currentRows = rows.slice();
+    } else {
+        const filtered = new Int32Array(rows.length);
+        let count = 0;
+        for (let j = 0, n = rows.length; j < n; j++) {
+            const i = rows[j];
+            if (statuses[i] === activeFilter) {
+                filtered[count++] = i;
+            }
+        }
+        currentRows = filtered.subarray(0, count);
+    }
+
+    renderTable();
+    updateStats();
+}
+
+// Debounce typing so a burst of keystrokes triggers a single filter + render;
+// clearing the box applies immediately so going back to the full list feels instant
+const SEARCH_DEBOUNCE_MS = 120;
+let searchTimer;
+searchInput.addEventListener('input', () => {
+    clearTimeout(searchTimer);
+    if (searchInput.value === '') {
+        applyFilters();
+    } else {
+        searchTimer = setTimeout(applyFilters, SEARCH_DEBOUNCE_MS);
+    }
+});
+
+// Filter by status functionality
+function filterByStatus(status) {
+    // Toggle filter
+    if (activeFilter === status) {
+        activeFilter = null;
+        // Remove active class from all buttons
+        document.querySelectorAll('.filter-btn').forEach(btn => btn.classList.remove('active'));
+    } else {
+        activeFilter = status;
+        // Remove active class from all buttons
+        document.querySelectorAll('.filter-btn').forEach(btn => btn.classList.remove('active'));
+        // Add active class to clicked button
+        document.querySelector(`.filter-btn.${status}`).classList.add('active');
+    }
+
+    applyFilters();
+}
+
+// Reset filter
+function resetFilter() {
+    activeFilter = null;
+    searchInput.value = '';
+    // Remove active class from all buttons
+    document.querySelectorAll('.filter-btn').forEach(btn => btn.classList.remove('active'));
+    applyFilters();
+}
+
+// Lowercased sort keys (one flat array per column, SORT_KEYS[column][row]) and
+// the status priority are computed once at load, and each column/direction gets
+// its own comparator, so sort() neither lowercases nor branches on the column
+// inside the comparison
+// Status order: eligible (0), grace (1), ineligible (2)
+const STATUS_PRIORITY = { eligible: 0, grace: 1, ineligible: 2 };
+const SORT_KEYS = [addressIndex, ensIndex, new Array(ROW_COUNT), new Array(ROW_COUNT)];
+const priorities = new Int32Array(ROW_COUNT);
+for (let i = 0; i < ROW_COUNT; i++) {
+    const row = originalData[i];
+    SORT_KEYS[2][i] = row[2].toLowerCase();
+    SORT_KEYS[3][i] = row[3].toLowerCase();
+    priorities[i] = STATUS_PRIORITY[row[2]] ?? 3;
+}
+
+const compareKeys = (x, y) => (x < y ? -1 : x > y ? 1 : 0);
+
+// One straight-line comparator per column and direction: descending swaps the
+// arguments instead of multiplying by a direction, so nothing inside a
+// comparison depends on which header was clicked. Arguments are row indices.
+const byKey = k => {
+    const keys = SORT_KEYS[k];
+    return (a, b) => compareKeys(keys[a], keys[b]);
+};
+const byKeyDesc = k => {
+    const keys = SORT_KEYS[k];
+    return (a, b) => compareKeys(keys[b], keys[a]);
+};
+
+// Address and eligible-until always keep status priority (ascending) first
+const byPriorityThenKey = k => {
+    const keys = SORT_KEYS[k];
+    return (a, b) => (priorities[a] - priorities[b]) || compareKeys(keys[a], keys[b]);
+};
+const byPriorityThenKeyDesc = k => {
+    const keys = SORT_KEYS[k];
+    return (a, b) => (priorities[a] - priorities[b]) || compareKeys(keys[b], keys[a]);
+};
+
+const COMPARATORS = {
+    asc: [byPriorityThenKey(0), byKey(1), byKey(2), byPriorityThenKey(3)],
+    desc: [byPriorityThenKeyDesc(0), byKeyDesc(1), byKeyDesc(2), byPriorityThenKeyDesc(3)]
+};
+
+// Sorting functionality
+function sortTable(column) {
+    if (sortColumn === column) {
+        sortDirection = sortDirection === 'asc' ? 'desc' : 'asc';
+    } else {
+        sortColumn = column;
+        sortDirection = 'asc';
+    }
+
+    const compare = COMPARATORS[sortDirection][column];
+
+    // Special handling when sorting by ENS name column (index 1)
+    if (column === 1) {
+        // Separate rows with ENS from rows without ENS
+        const n = currentRows.length;
+        const ensKeys = SORT_KEYS[1];
+        const withENS = new Int32Array(n);
+        const withoutENS = new Int32Array(n);
+        let ensCount = 0;
+        let noEnsCount = 0;
+
+        for (let i = 0; i < n; i++) {
+            const r = currentRows[i];
+            const ens = ensKeys[r];
+            if (ens === '' || ens === 'no ens') {
+                withoutENS[noEnsCount++] = r;
+            } else {
+                withENS[ensCount++] = r;
+            }
+        }
+
+        // Sort only the rows with ENS
+        const sortedENS = withENS.subarray(0, ensCount).sort(compare);
+        const unsortedNoENS = withoutENS.subarray(0, noEnsCount);
+
+        // Combine: sorted ENS rows + unsorted no-ENS rows at the end
+        const combined = new Int32Array(n);
+        if (sortDirection === 'asc') {
+            combined.set(sortedENS);
+            combined.set(unsortedNoENS, ensCount);
+        } else {
+            // In descending order, put no-ENS at beginning
+            combined.set(unsortedNoENS);
+            combined.set(sortedENS, noEnsCount);
+        }
+        currentRows = combined;
+    } else {
+        currentRows.sort(compare);
+    }
+
+    renderTable();
+    updateSortHeaders();
+}
+
+// Large tables are windowed: only the rows in view (plus some overscan) are
+// kept in the DOM, with spacer rows preserving the scrollbar geometry
+const tableContainer = document.querySelector('.table-container');
+const OVERSCAN = 20;
+let rowHeight = 0;
+let scrollFrame = null;
+
+if (VIRTUALIZE) {
+    tableContainer.classList.add('virtualized');
+    tableContainer.addEventListener('scroll', () => {
+        if (scrollFrame === null) {
+            scrollFrame = requestAnimationFrame(() => {
+                scrollFrame = null;
+                renderTable();
+            });
+        }
+    });
+}
+
+// Rows are cloned from the <template> and filled in with textContent, which
+// skips the HTML parser and never interprets indexer data as markup
+const rowTemplate = document.getElementById('rowTemplate').content.firstElementChild;
+const EXPLORER_URL_PREFIX = 'https://thegraph.com/explorer/profile/';
+const EXPLORER_URL_SUFFIX = '?view=Indexing&chain=arbitrum-one';
+const STATUS_BADGE_CLASS = { eligible: 'good', grace: 'grace', ineligible: 'ineligible' };
+
+// Rendered rows are recycled: slot i of rowPool is the i-th row currently shown,
+// and a re-render only rewrites textContent/href/className on those nodes,
+// cloning the template just for slots the table has never needed before
+const rowPool = [];
+let attachedRows = 0;
+
+// `index` is the row's position in currentRows; stripes follow it rather than the
+// row's place in the tbody, which in windowed mode starts after the top spacer
+function fillRow(tr, row, index) {
+    const [address, ensName, status, eligibleUntil] = row;
+    const cells = tr.cells;
+    tr.className = index % 2 ? 'striped' : '';
+
+    const link = cells[0].firstElementChild;
+    link.href = EXPLORER_URL_PREFIX + address + EXPLORER_URL_SUFFIX;
+    link.firstElementChild.textContent = address;
+
+    const ensSpan = cells[1].firstElementChild;
+    ensSpan.className = ensName ? 'ens-name' : 'empty-ens';
+    ensSpan.textContent = ensName || 'No ENS';
+
+    // Unknown statuses get the ineligible badge, as on the server side
+    const badgeStatus = STATUS_BADGE_CLASS[status] ? status : 'ineligible';
+    const badge = cells[2].firstElementChild;
+    badge.className = 'legend-badge ' + STATUS_BADGE_CLASS[badgeStatus];
+    badge.textContent = badgeStatus;
+
+    cells[3].textContent = eligibleUntil;
+}
+
+function spacerRow() {
+    const tr = document.createElement('tr');
+    const td = document.createElement('td');
+    tr.className = 'spacer';
+    td.colSpan = 4;
+    td.style.height = '0px';
+    tr.appendChild(td);
+    return tr;
+}
+
+// In windowed mode the two spacers stay in the tbody for good and only their
+// heights change; pooled rows always sit between them
+const topSpacer = VIRTUALIZE ? spacerRow() : null;
+const bottomSpacer = VIRTUALIZE ? spacerRow() : null;
+if (VIRTUALIZE) tableBody.replaceChildren(topSpacer, bottomSpacer);
+
+// Show currentRows[from..to) in the pool slots starting at `slot`; slots that
+// are not in the tbody yet are inserted together, in order, after the others
+function fillSlots(from, to, slot) {
+    const fragment = document.createDocumentFragment();
+    for (let i = from; i < to; i++, slot++) {
+        let tr = rowPool[slot];
+        if (!tr) tr = rowPool[slot] = rowTemplate.cloneNode(true);
+        fillRow(tr, originalData[currentRows[i]], i);
+        if (slot >= attachedRows) fragment.appendChild(tr);
+    }
+    if (fragment.firstChild) tableBody.insertBefore(fragment, bottomSpacer);
+    attachedRows = Math.max(attachedRows, slot);
+}
+
+// Detach pooled rows past the first `count`; they stay in the pool for reuse
+function trimSlots(count) {
+    while (attachedRows > count) {
+        rowPool[--attachedRows].remove();
+    }
+}
+
+// Full (non-windowed) renders put the first chunk of rows in synchronously and
+// fill the rest one chunk per animation frame, so a keystroke never waits for
+// the whole table; starting a new render cancels the one still in flight
+const RENDER_CHUNK = 100;
+let pendingRender = null;
+
+function renderTable() {
+    if (pendingRender !== null) {
+        cancelAnimationFrame(pendingRender);
+        pendingRender = null;
+    }
+    const total = currentRows.length;
+
+    if (!VIRTUALIZE) {
+        let next = Math.min(total, RENDER_CHUNK);
+        trimSlots(total);
+        fillSlots(0, next, 0);
+
+        const renderNextChunk = () => {
+            const stop = Math.min(total, next + RENDER_CHUNK);
+            fillSlots(next, stop, next);
+            next = stop;
+            pendingRender = next < total ? requestAnimationFrame(renderNextChunk) : null;
+        };
+        if (next < total) pendingRender = requestAnimationFrame(renderNextChunk);
+        return;
+    }
+
+    // Windowed: resize the spacers around the visible slice and refill the pool
+    const rowH = rowHeight || 50;
+    const start = Math.max(0, Math.floor(tableContainer.scrollTop / rowH) - OVERSCAN);
+    const end = Math.min(total, start + Math.ceil(tableContainer.clientHeight / rowH) + 2 * OVERSCAN);
+
+    topSpacer.firstChild.style.height = (start * rowH) + 'px';
+    bottomSpacer.firstChild.style.height = ((total - end) * rowH) + 'px';
+    trimSlots(Math.max(0, end - start));
+    fillSlots(start, end, 0);
+
+    // Measure a real row once so the spacers match the rendered layout
+    if (!rowHeight && end > start) {
+        const measured = rowPool[0].getBoundingClientRect().height;
+        if (measured > 0) {
+            rowHeight = measured;
+            if (Math.abs(measured - rowH) > 1) renderTable();
+        }
+    }
+}
+
+// The header row never changes, so look the sortable headers up once
+const SORT_HEADERS = document.querySelectorAll('th.sortable');
+
+function updateSortHeaders() {
+    SORT_HEADERS.forEach((header, index) => {
+        header.className = 'sortable';
+        if (index === sortColumn) {
+            header.classList.add(sortDirection === 'asc' ? 'sort-asc' : 'sort-desc');
+        }
+    });
+}
+
+function updateStats() {
+    totalCount.textContent = ROW_COUNT;
+    filteredCount.textContent = currentRows.length;
+}
+
+// Add click handlers to sortable headers
+SORT_HEADERS.forEach((header, index) => {
+    header.addEventListener('click', () => sortTable(index));
+});
+
+// Initialize
+renderTable();
+updateStats();
@@ -6,13 +6,24 @@ This script reads indexer data from indexers.txt and generates a static HTML das
 with sortable table and search functionality.
 """
 
+import gzip
+import hashlib
+import io
 import os
 import json
+import mmap
+import re
 import requests
 import shutil
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import List, Tuple, Optional
+from typing import Any, Iterable, List, Tuple, Optional, TextIO, Union
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Version of the dashboard generator
 VERSION = "0.0.8"
@@ -24,6 +35,122 @@ try:
 except ImportError:
     TELEGRAM_AVAILABLE = False
 
+# Use orjson for JSON decoding/encoding when installed (falls back to the standard library)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode a JSON document, using orjson when available.
+    
+    Args:
+        data: JSON document as bytes or str
+        
+    Returns:
+        The decoded Python object
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dump_pretty(obj: Any, f: TextIO) -> None:
+    """
+    Write an object to a text file as 2-space indented JSON, using orjson when available.
+    
+    Args:
+        obj: JSON-serializable object
+        f: Text file opened for writing
+    """
+    if ORJSON_AVAILABLE:
+        f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8'))
+    else:
+        json.dump(obj, f, indent=2)
+
+
+def _create_session() -> requests.Session:
+    """
+    Create the HTTP session shared by the RPC, Arbiscan and subgraph helpers.
+    
+    Reusing one session keeps connections to the same host alive between calls, so
+    repeated RPC requests don't each pay for a new TCP + TLS handshake.
+    
+    Returns:
+        Configured requests.Session with a pooled, retrying adapter
+    """
+    session = requests.Session()
+    # Retry transient failures with exponential backoff. POST is included because
+    # every POST sent here is a read-only JSON-RPC call or GraphQL query, so repeating it is safe
+    retries = Retry(
+        total=3,
+        connect=2,
+        read=2,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'POST']),
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=64, max_retries=retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({'Connection': 'keep-alive', 'Content-Type': 'application/json'})
+    return session
+
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Get the shared HTTP session, creating it on first use.
+    
+    Returns:
+        The process-wide requests.Session
+    """
+    global _SESSION
+    if _SESSION is None:
+        # Locked so concurrent first callers don't each build a session
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = _create_session()
+    return _SESSION
+
+
+# (connect, read) timeout in seconds for the shared session helpers: fail fast when the host
+# can't be reached, but give slow responses time to arrive
+HTTP_TIMEOUT = (3.05, 10)
+
+# Default number of eth_calls sent per JSON-RPC batch request; providers cap batch
+# sizes, so it can be lowered with the RPC_BATCH_SIZE environment variable
+RPC_BATCH_SIZE = 50
+
+# Upper bound on JSON-RPC batch requests in flight at once (well below the session's pool size)
+RPC_MAX_WORKERS = 8
+
+# Contract function selectors: the first 4 bytes of keccak256(signature). Calls to the
+# zero-argument getters send the bare selector as calldata, no padding
+SEL_IS_ELIGIBLE = '0x66e305fd'    # isEligible(address)
+SEL_RENEWAL_TIME = '0xd353402d'   # getEligibilityRenewalTime(address)
+SEL_ORACLE_TIME = '0xbe626dd2'    # getLastOracleUpdateTime()
+SEL_ELIG_PERIOD = '0xd0a5379e'    # getEligibilityPeriod()
+
+# Multicall3 is deployed at the same address on Arbitrum and most other EVM chains;
+# one aggregate3() eth_call runs many read calls and returns all their results
+MULTICALL3_ADDRESS = '0xcA11bde05977b3631167028862bE2a173976CA11'
+SEL_AGGREGATE3 = '0x82ad56cb'     # aggregate3((address,bool,bytes)[])
+
+# Wall-clock budget in seconds for finding the last transaction through QuickNode; once
+# it runs out the lookup gives up and the Arbiscan API is tried instead
+LAST_TX_TIME_BUDGET = 5.0
+
+# Calls bundled into one aggregate3() eth_call; keeps each call well inside the
+# node's eth_call gas cap
+MULTICALL_CHUNK_SIZE = 200
+
 
 def get_last_transaction_from_json(json_file: str = 'last_transaction.json') -> Optional[dict]:
     """
@@ -38,7 +165,7 @@ def get_last_transaction_from_json(json_file: str = 'last_transaction.json') ->
     try:
         if os.path.exists(json_file):
             with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                data = json_loads(f.read())
                 print(f"Loaded transaction data from {json_file}")
                 return data
         else:
@@ -58,9 +185,10 @@ def save_transaction_to_json(transaction_data: dict, json_file: str = 'last_tran
         json_file: Path to the JSON file to save to
     """
     try:
-        # Add the script run timestamp
-        current_timestamp = int(datetime.now(timezone.utc).timestamp())
-        current_readable = datetime.now(timezone.utc).strftime("%b-%d-%Y %H:%M:%S")
+        # Add the script run timestamp (one clock read, so both forms always agree)
+        now = datetime.now(timezone.utc)
+        current_timestamp = int(now.timestamp())
+        current_readable = now.strftime("%b-%d-%Y %H:%M:%S")
         
         # Create the data structure with the script run timestamp
         data_to_save = transaction_data.copy()
@@ -69,7 +197,7 @@ def save_transaction_to_json(transaction_data: dict, json_file: str = 'last_tran
         
         # Save to file
         with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(data_to_save, f, indent=2)
+            json_dump_pretty(data_to_save, f)
         
         print(f"✓ Transaction data saved to {json_file} with timestamp")
     except Exception as e:
@@ -102,10 +230,10 @@ def get_last_transaction(contract_address: str, api_key: str) -> Optional[dict]:
             'apikey': api_key
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = get_session().get(url, params=params, timeout=HTTP_TIMEOUT)
         response.raise_for_status()
         
-        data = response.json()
+        data = json_loads(response.content)
         
         if data['status'] == '1' and data['result']:
             return data['result'][0]  # Return the first (latest) transaction
@@ -123,22 +251,194 @@ def get_last_transaction(contract_address: str, api_key: str) -> Optional[dict]:
         return None
 
 
-def get_last_transaction_via_quicknode(contract_address: str, quicknode_url: str) -> Optional[dict]:
+def rpc_batch(quicknode_url: str, calls: List[Tuple[str, list]],
+              timeout: Tuple[float, float] = HTTP_TIMEOUT,
+              session: Optional[requests.Session] = None) -> List[Optional[Any]]:
+    """
+    Send several JSON-RPC calls to QuickNode in a single HTTP POST.
+    
+    The calls are sent as one JSON-RPC batch (an array of request objects), so N calls
+    cost one round-trip instead of N.
+    
+    Args:
+        quicknode_url: QuickNode RPC endpoint URL
+        calls: List of (method, params) tuples
+        timeout: (connect, read) timeout in seconds
+        session: Session to send the request with; the shared retrying session if None
+        
+    Returns:
+        List of results in the same order as calls; an entry is None if that call
+        failed (or all entries are None if the request itself failed)
+    """
+    if not calls:
+        return []
+    
+    try:
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        response = (session or get_session()).post(quicknode_url, json=payload, timeout=timeout)
+        response.raise_for_status()
+        data = json_loads(response.content)
+        
+        if not isinstance(data, list):
+            # A single error object is returned when the whole batch is rejected
+            error = data.get("error") if isinstance(data, dict) else data
+            print(f"QuickNode RPC batch error: {error}")
+            return [None] * len(calls)
+        
+        # Responses may come back in any order; match them up by id
+        results: List[Optional[Any]] = [None] * len(calls)
+        for item in data:
+            call_id = item.get("id")
+            if not isinstance(call_id, int) or not 0 <= call_id < len(calls):
+                continue
+            if item.get("error"):
+                print(f"QuickNode RPC error for {calls[call_id][0]}: {item['error']}")
+                continue
+            results[call_id] = item.get("result")
+        return results
+    except Exception as e:
+        print(f"QuickNode RPC batch exception: {e}")
+        return [None] * len(calls)
+
+
+def _abi_word(value: int) -> str:
+    """Encode a non-negative integer as one 32-byte ABI word (64 hex chars, no 0x)."""
+    return format(value, '064x')
+
+
+def _abi_address(address: str) -> str:
+    """Encode an address as one 32-byte ABI word: drop the 0x, lowercase, left-pad with zeros."""
+    return (address[2:] if address.startswith('0x') else address).lower().zfill(64)
+
+
+def encode_aggregate3(target: str, calldatas: List[str]) -> str:
+    """
+    ABI-encode a Multicall3 aggregate3() call that sends each calldata to one target.
+    
+    Every Call3 entry is (target, allowFailure=true, callData), so a reverting call
+    shows up as a failed entry in the result instead of reverting the whole batch.
+    
+    Args:
+        target: Address every call is sent to
+        calldatas: Hex calldata ('0x' + selector + arguments) of each call
+        
+    Returns:
+        Hex calldata for the aggregate3() eth_call to MULTICALL3_ADDRESS
+    """
+    target_word = _abi_address(target)
+    heads = []
+    tails = []
+    # Offsets of the dynamic Call3 tuples count from the first head word
+    offset = 32 * len(calldatas)
+    for calldata in calldatas:
+        data = calldata[2:] if calldata.startswith('0x') else calldata
+        padded = data.ljust(-(-len(data) // 64) * 64, '0')
+        # (address target, bool allowFailure, bytes callData): the bytes sit after the 3 head words
+        element = target_word + _abi_word(1) + _abi_word(0x60) + _abi_word(len(data) // 2) + padded
+        heads.append(_abi_word(offset))
+        tails.append(element)
+        offset += len(element) // 2
+    return SEL_AGGREGATE3 + _abi_word(0x20) + _abi_word(len(calldatas)) + ''.join(heads) + ''.join(tails)
+
+
+def decode_aggregate3(result: str) -> List[Optional[str]]:
+    """
+    Decode the (bool success, bytes returnData)[] returned by aggregate3().
+    
+    Args:
+        result: Hex return data of the aggregate3() eth_call
+        
+    Returns:
+        The return data of each call as a '0x' hex string, in call order, or None for
+        calls that failed
+        
+    Raises:
+        ValueError: If the return data is not a well-formed aggregate3() result
+    """
+    raw = bytes.fromhex(result[2:] if result.startswith('0x') else result)
+    
+    def word(position: int) -> int:
+        if position + 32 > len(raw):
+            raise ValueError("aggregate3 result is truncated")
+        return int.from_bytes(raw[position:position + 32], 'big')
+    
+    array_start = word(0)
+    count = word(array_start)
+    heads_start = array_start + 32
+    decoded: List[Optional[str]] = []
+    for i in range(count):
+        element = heads_start + word(heads_start + 32 * i)
+        data_start = element + word(element + 32)
+        length = word(data_start)
+        if data_start + 32 + length > len(raw):
+            raise ValueError("aggregate3 result is truncated")
+        decoded.append('0x' + raw[data_start + 32:data_start + 32 + length].hex() if word(element) else None)
+    return decoded
+
+
+def rpc_multicall(quicknode_url: str, target: str, calldatas: List[str]) -> Optional[List[Optional[str]]]:
+    """
+    Run several read calls against one contract in a single Multicall3 eth_call.
+    
+    Args:
+        quicknode_url: QuickNode RPC endpoint URL
+        target: Address every call is sent to
+        calldatas: Hex calldata of each call
+        
+    Returns:
+        The return data of each call in call order (None for calls that reverted), or
+        None if the aggregate call itself failed and the calls should be sent directly
+    """
+    call = ("eth_call", [{"to": MULTICALL3_ADDRESS, "data": encode_aggregate3(target, calldatas)}, "latest"])
+    result = rpc_batch(quicknode_url, [call])[0]
+    if result in (None, '0x'):
+        return None
+    try:
+        decoded = decode_aggregate3(result)
+    except ValueError as e:
+        print(f"⚠ Could not decode Multicall3 result: {e}")
+        return None
+    return decoded if len(decoded) == len(calldatas) else None
+
+
+def get_last_transaction_via_quicknode(contract_address: str, quicknode_url: str,
+                                       time_budget: float = LAST_TX_TIME_BUDGET) -> Optional[dict]:
     """
     Get the last transaction touching the contract using a QuickNode RPC endpoint.
-    Strategy: Scan recent blocks and find transactions where 'to' == contract address.
-    Skips eth_getLogs entirely as it causes 413 errors on contracts with many events.
+    Strategy: Query the contract's logs over the recent block window with eth_getLogs
+    (split into a few smaller ranges sent as one batch, to stay under the node's
+    response limits). Only if the node refuses the query (-32005 or HTTP 413) fall back
+    to scanning recent blocks for transactions where 'to' == contract address.
+    No new request is started once time_budget seconds have passed, and every request
+    is sent without retries and with its timeouts capped at the time left, so a slow
+    node can't hold up the dashboard for longer than the budget; the lookup then
+    returns None.
     Returns a dict with 'hash', 'blockNumber' (as decimal string), and 'timeStamp' (as decimal string) or None.
     """
+    deadline = time.monotonic() + time_budget
+    scan_window = 100
+    log_shards = 4
+    scan_probe = 4
+    # A plain session: the shared one retries timed-out POSTs, which would let a single
+    # stalled request outlast the whole budget
+    session = requests.Session()
+    
+    def remaining_timeout() -> Tuple[float, float]:
+        left = max(0.1, deadline - time.monotonic())
+        return (min(HTTP_TIMEOUT[0], left), min(HTTP_TIMEOUT[1], left))
+    
     def rpc_call(method: str, params: list) -> Optional[dict]:
         try:
-            response = requests.post(
+            response = session.post(
                 quicknode_url,
                 json={"jsonrpc": "2.0", "id": 1, "method": method, "params": params},
-                timeout=15,
+                timeout=remaining_timeout(),
             )
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             if isinstance(data, dict) and data.get("error"):
                 print(f"QuickNode RPC error for {method}: {data['error']}")
                 return None
@@ -147,11 +447,94 @@ def get_last_transaction_via_quicknode(contract_address: str, quicknode_url: str
             print(f"QuickNode RPC exception for {method}: {e}")
             return None
 
+    def out_of_time(step: str) -> bool:
+        if time.monotonic() < deadline:
+            return False
+        print(f"⚠ QuickNode lookup exceeded its {time_budget:g}s budget, skipping {step}")
+        return True
+
     def hex_to_dec_str(hex_str: Optional[str]) -> str:
         try:
             return str(int(hex_str, 16)) if hex_str else "0"
         except Exception:
             return "0"
+    
+    def fetch_contract_logs(latest_int: int) -> Optional[list]:
+        # Returns the contract's logs in the window, or None if the node refused the
+        # range (too many results) and the caller should scan blocks instead
+        first_block = max(0, latest_int - scan_window + 1)
+        shard_size = -(-(latest_int - first_block + 1) // log_shards)
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "eth_getLogs",
+                "params": [{
+                    "address": contract_address,
+                    "fromBlock": hex(start),
+                    "toBlock": hex(min(start + shard_size - 1, latest_int)),
+                }],
+            }
+            for i, start in enumerate(range(first_block, latest_int + 1, shard_size))
+        ]
+        response = session.post(quicknode_url, json=payload, timeout=remaining_timeout())
+        if response.status_code == 413:
+            return None
+        response.raise_for_status()
+        data = json_loads(response.content)
+        
+        if not isinstance(data, list):
+            data = [data]
+        logs = []
+        for item in data:
+            error = item.get("error")
+            if error:
+                if error.get("code") == -32005:
+                    return None
+                raise RuntimeError(f"eth_getLogs error: {error}")
+            logs.extend(item.get("result") or [])
+        return logs
+    
+    def scan_blocks(latest_int: int) -> Optional[dict]:
+        print(f"Scanning last {scan_window} blocks for transactions to {contract_address}...")
+        
+        # Fetch the window newest first in growing probes (the newest scan_probe blocks,
+        # then 4x as far back each time, up to scan_window) with full transaction objects
+        # inline, one batched request per probe, and stop at the first probe with a match:
+        # recent activity costs a handful of blocks while the worst case is unchanged
+        contract_lower = contract_address.lower()
+        oldest = max(-1, latest_int - scan_window)
+        scanned, probe = 0, scan_probe
+        
+        while latest_int - scanned > oldest:
+            if out_of_time("the rest of the block scan"):
+                return None
+            block_numbers = range(latest_int - scanned, max(oldest, latest_int - probe), -1)
+            scanned, probe = probe, min(probe * 4, scan_window)
+            blocks = rpc_batch(quicknode_url, [("eth_getBlockByNumber", [hex(n), True]) for n in block_numbers],
+                               timeout=remaining_timeout(), session=session)
+            
+            for block_num, block in zip(block_numbers, blocks):
+                if not isinstance(block, dict):
+                    continue
+                
+                # Check each transaction in reverse order (most recent first)
+                for tx in reversed(block.get("transactions") or []):
+                    if not isinstance(tx, dict):
+                        continue
+                    
+                    to_addr = (tx.get("to") or "").lower()
+                    if to_addr and to_addr == contract_lower:
+                        tx_hash = tx.get("hash", "")
+                        print(f"Found transaction in block {block_num}: {tx_hash}")
+                        return {
+                            "hash": tx_hash,
+                            "blockNumber": hex_to_dec_str(block.get("number")),
+                            "timeStamp": hex_to_dec_str(block.get("timestamp")),
+                        }
+        
+        print(f"No transactions found in last {scan_window} blocks")
+        return None
 
     try:
         print("Fetching latest block number...")
@@ -160,137 +543,199 @@ def get_last_transaction_via_quicknode(contract_address: str, quicknode_url: str
             return None
         latest_int = int(latest_hex, 16)
         print(f"Latest block: {latest_int}")
-
-        # Scan recent blocks for transactions to the contract
-        # Start with a reasonable window
-        scan_window = 100
-        print(f"Scanning last {scan_window} blocks for transactions to {contract_address}...")
         
-        for block_num in range(latest_int, max(-1, latest_int - scan_window), -1):
-            # Get block with transaction hashes only (not full tx objects)
-            block = rpc_call("eth_getBlockByNumber", [hex(block_num), False])
-            if not isinstance(block, dict):
-                continue
-            
-            timestamp_hex = block.get("timestamp")
-            tx_hashes = block.get("transactions") or []
-            
-            # Check each transaction in reverse order (most recent first)
-            for tx_hash in reversed(tx_hashes):
-                tx = rpc_call("eth_getTransactionByHash", [tx_hash])
-                if not isinstance(tx, dict):
-                    continue
-                
-                to_addr = (tx.get("to") or "").lower()
-                if to_addr and to_addr == contract_address.lower():
-                    print(f"Found transaction in block {block_num}: {tx_hash}")
-                    return {
-                        "hash": tx.get("hash", ""),
-                        "blockNumber": hex_to_dec_str(block.get("number")),
-                        "timeStamp": hex_to_dec_str(timestamp_hex),
-                    }
+        if out_of_time("eth_getLogs"):
+            return None
+        print(f"Querying contract logs in the last {scan_window} blocks...")
+        logs = fetch_contract_logs(latest_int)
+        if logs is None:
+            print("⚠ eth_getLogs range refused by the node, falling back to block scan")
+            return scan_blocks(latest_int)
+        
+        if not logs:
+            print(f"No transactions found in last {scan_window} blocks")
+            return None
         
-        print(f"No transactions found in last {scan_window} blocks")
-        return None
+        # The newest log (highest block, then highest log index) belongs to the last transaction
+        last_log = max(logs, key=lambda log: (int(log.get("blockNumber", "0x0"), 16),
+                                              int(log.get("logIndex") or "0x0", 16)))
+        block = rpc_call("eth_getBlockByNumber", [last_log.get("blockNumber"), False])
+        if not isinstance(block, dict):
+            return None
+        
+        tx_hash = last_log.get("transactionHash", "")
+        print(f"Found transaction in block {hex_to_dec_str(last_log.get('blockNumber'))}: {tx_hash}")
+        return {
+            "hash": tx_hash,
+            "blockNumber": hex_to_dec_str(last_log.get("blockNumber")),
+            "timeStamp": hex_to_dec_str(block.get("timestamp")),
+        }
     except Exception as e:
         print(f"Error in get_last_transaction_via_quicknode: {e}")
         return None
+    finally:
+        session.close()
+
+
+# strftime formats: the 'retrieved'/'last check' stamps in the JSON files, and the
+# eligible-until date of indexers in their grace period, e.g. 2-Nov-2025 at 19:25:55 UTC
+# (day without leading zero)
+_METADATA_TS_FMT = '%Y-%m-%d %H:%M:%S UTC'
+_ELIGIBLE_UNTIL_FMT = '%-d-%b-%Y at %H:%M:%S UTC'
+
+# Cache for contract reads that rarely change, shared between runs
+RPC_CACHE_FILE = '.rpc_cache.json'
+
+# Contract parameters read by get_contract_parameters():
+# (cache key, function selector, label, cache TTL in seconds or None to always read it)
+_CONTRACT_PARAMETERS = (
+    # getLastOracleUpdateTime(): always read live; eligibility statuses and the
+    # renewal-times cache are keyed on it, so a stale value would misreport indexers
+    ('oracle_update_time', SEL_ORACLE_TIME, 'Oracle update time', None),
+    # getEligibilityPeriod(): a governance setting that almost never changes
+    ('eligibility_period', SEL_ELIG_PERIOD, 'Eligibility period', 24 * 60 * 60),
+)
 
+# getEligibilityRenewalTime(address) results, cached per contract together with the
+# oracle update time they were read at; they are only reused while that is unchanged
+RENEWAL_TIMES_CACHE_TTL = 24 * 60 * 60
 
-def get_oracle_update_time(contract_address: str, quicknode_url: str) -> Optional[int]:
+
+def load_cached(key: str, ttl_seconds: float, cache_file: str = RPC_CACHE_FILE) -> Optional[Any]:
     """
-    Get the last oracle update time from the contract by calling getLastOracleUpdateTime().
+    Get a value from the RPC cache if it was stored less than ttl_seconds ago.
     
     Args:
-        contract_address: The contract address
-        quicknode_url: QuickNode RPC endpoint URL
+        key: Cache key
+        ttl_seconds: Maximum age of the cached value in seconds
+        cache_file: Path to the cache file
         
     Returns:
-        Unix timestamp of last oracle update or None if error
+        The cached value, or None if missing, expired or unreadable
     """
     try:
-        # Function selector for getLastOracleUpdateTime()
-        # keccak256("getLastOracleUpdateTime()") = 0xbe626dd2...
-        function_selector = '0xbe626dd2' + '0' * 56  # Padded to 32 bytes
-        
-        payload = {
-            'jsonrpc': '2.0',
-            'method': 'eth_call',
-            'params': [{
-                'to': contract_address,
-                'data': function_selector
-            }, 'latest'],
-            'id': 1
-        }
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            entry = json.load(f).get(key)
+        if entry and time.time() - entry['fetched_at'] < ttl_seconds:
+            return entry['value']
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+    return None
+
+
+def store_cached(key: str, value: Any, cache_file: str = RPC_CACHE_FILE) -> None:
+    """
+    Store a value in the RPC cache together with the time it was fetched.
+    
+    Args:
+        key: Cache key
+        value: JSON-serializable value to store
+        cache_file: Path to the cache file
+    """
+    try:
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
         
-        response = requests.post(quicknode_url, json=payload, timeout=10)
-        result = response.json()
+        cache[key] = {'value': value, 'fetched_at': time.time()}
         
-        if 'result' in result and result['result'] != '0x':
-            timestamp = int(result['result'], 16)
-            print(f"Oracle update time retrieved: {timestamp}")
-            return timestamp
-        else:
-            error_msg = result.get('error', {}).get('message', 'Unknown error')
-            print(f"Error getting oracle update time: {error_msg}")
-            return None
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json_dump_pretty(cache, f)
     except Exception as e:
-        print(f"Exception getting oracle update time: {e}")
-        return None
+        print(f"⚠ Warning: Could not update {cache_file}: {e}")
+
+
+def invalidate_cached(key_prefix: str, cache_file: str = RPC_CACHE_FILE) -> None:
+    """
+    Remove all RPC cache entries whose key starts with key_prefix.
+    
+    Args:
+        key_prefix: Prefix of the cache keys to drop
+        cache_file: Path to the cache file
+    """
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return
+    
+    remaining = {key: entry for key, entry in cache.items() if not key.startswith(key_prefix)}
+    if len(remaining) != len(cache):
+        try:
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json_dump_pretty(remaining, f)
+        except OSError as e:
+            print(f"⚠ Warning: Could not update {cache_file}: {e}")
 
 
-def get_eligibility_period(contract_address: str, quicknode_url: str) -> Optional[int]:
+def get_contract_parameters(contract_address: str, quicknode_url: str) -> Tuple[Optional[int], Optional[int]]:
     """
-    Get the eligibility period from the contract by calling getEligibilityPeriod().
+    Get the last oracle update time and the eligibility period in one batched RPC request.
+    
+    Calls getLastOracleUpdateTime() and getEligibilityPeriod() on the contract, with
+    both eth_calls in a single JSON-RPC batch. Values still fresh in the RPC
+    cache (see _CONTRACT_PARAMETERS for the TTLs) are not requested at all; the oracle
+    update time is never cached.
     
     Args:
         contract_address: The contract address
         quicknode_url: QuickNode RPC endpoint URL
         
     Returns:
-        Eligibility period in seconds or None if error
+        Tuple of (last oracle update timestamp, eligibility period in seconds); either
+        value is None if its call failed
     """
-    try:
-        # Function selector for getEligibilityPeriod()
-        # keccak256("getEligibilityPeriod()") = 0xd0a5379e...
-        function_selector = '0xd0a5379e' + '0' * 56  # Padded to 32 bytes
-        
-        payload = {
-            'jsonrpc': '2.0',
-            'method': 'eth_call',
-            'params': [{
-                'to': contract_address,
-                'data': function_selector
-            }, 'latest'],
-            'id': 1
-        }
-        
-        response = requests.post(quicknode_url, json=payload, timeout=10)
-        result = response.json()
-        
-        if 'result' in result and result['result'] != '0x':
-            period = int(result['result'], 16)
-            print(f"Eligibility period retrieved: {period} seconds")
-            return period
+    values = {}
+    missing = []
+    for name, selector, label, ttl in _CONTRACT_PARAMETERS:
+        cache_key = f"{name}:{contract_address.lower()}" if ttl is not None else None
+        cached = load_cached(cache_key, ttl) if cache_key else None
+        if cached is not None:
+            print(f"✓ {label} from cache: {cached}")
+            values[name] = cached
         else:
-            error_msg = result.get('error', {}).get('message', 'Unknown error')
-            print(f"Error getting eligibility period: {error_msg}")
-            return None
-    except Exception as e:
-        print(f"Exception getting eligibility period: {e}")
-        return None
+            missing.append((name, selector, label, cache_key))
+    
+    if missing:
+        calls = [
+            ("eth_call", [{"to": contract_address, "data": selector}, "latest"])
+            for _, selector, _, _ in missing
+        ]
+        for (name, _, label, cache_key), result in zip(missing, rpc_batch(quicknode_url, calls)):
+            if result and result != '0x':
+                values[name] = int(result, 16)
+                print(f"{label} retrieved: {values[name]}")
+                if cache_key:
+                    store_cached(cache_key, values[name])
+            else:
+                print(f"Error getting {label.lower()}")
+                values[name] = None
+    
+    return values['oracle_update_time'], values['eligibility_period']
 
 
-def save_ens_cache(ens_mapping: dict, cache_file: str = 'ens_resolution.json') -> None:
+# ENS names rarely change, so a cached resolution is reused for a week before the
+# address is looked up again
+ENS_CACHE_TTL = 7 * 24 * 3600
+
+
+def save_ens_cache(ens_mapping: dict, cache_file: str = 'ens_resolution.json', resolved_at: Optional[dict] = None) -> None:
     """
     Save ENS resolution data to a cache file.
     
+    The file is written to a temporary name first and then renamed over the old one,
+    so an interrupted run never leaves a truncated cache behind.
+    
     Args:
         ens_mapping: Dictionary mapping addresses (lowercase) to ENS names
         cache_file: Path to the cache file
+        resolved_at: Optional dictionary mapping addresses (lowercase) to the Unix time
+            they were last looked up, including addresses without an ENS name
     """
     try:
-        current_timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
+        current_timestamp = datetime.now(timezone.utc).strftime(_METADATA_TS_FMT)
         
         ens_resolved_count = len([name for name in ens_mapping.values() if name])
         
@@ -302,9 +747,13 @@ def save_ens_cache(ens_mapping: dict, cache_file: str = 'ens_resolution.json') -
             },
             "ens_resolutions": ens_mapping
         }
+        if resolved_at is not None:
+            cache_data["resolved_at"] = resolved_at
         
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, indent=2)
+        tmp_file = cache_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json_dump_pretty(cache_data, f)
+        os.replace(tmp_file, cache_file)
         
         print(f"✓ ENS cache updated and saved to {cache_file}")
         print(f"  - Total addresses: {len(ens_mapping)}")
@@ -323,10 +772,25 @@ def load_ens_cache(cache_file: str = 'ens_resolution.json') -> Optional[dict]:
     Returns:
         Dictionary mapping addresses (lowercase) to ENS names, or None if cache doesn't exist
     """
+    return load_ens_cache_entries(cache_file)[0]
+
+
+def load_ens_cache_entries(cache_file: str = 'ens_resolution.json') -> Tuple[Optional[dict], dict]:
+    """
+    Load ENS names and their per-address lookup times from the cache file in one read.
+    
+    Args:
+        cache_file: Path to the cache file
+        
+    Returns:
+        Tuple of (dictionary mapping addresses (lowercase) to ENS names, or None if the
+        cache doesn't exist; dictionary mapping addresses (lowercase) to the Unix time
+        they were last looked up, empty if the file predates per-address times)
+    """
     try:
         if not os.path.exists(cache_file):
             print(f"ENS cache file {cache_file} not found")
-            return None
+            return None, {}
         
         with open(cache_file, 'r', encoding='utf-8') as f:
             data = json.load(f)
@@ -334,18 +798,19 @@ def load_ens_cache(cache_file: str = 'ens_resolution.json') -> Optional[dict]:
         ens_mapping = data.get("ens_resolutions", {})
         metadata = data.get("metadata", {})
         retrieved = metadata.get("retrieved", "unknown")
+        resolved_at = data.get("resolved_at", {})
         
         print(f"✓ Loaded ENS cache from {cache_file} (retrieved: {retrieved})")
         print(f"  - Total entries: {metadata.get('total_count', 0)}")
         print(f"  - ENS resolved: {metadata.get('ens_resolved', 0)}")
         
-        return ens_mapping
+        return ens_mapping, resolved_at if isinstance(resolved_at, dict) else {}
     except Exception as e:
         print(f"Error loading ENS cache from {cache_file}: {e}")
-        return None
+        return None, {}
 
 
-def retrieveActiveIndexers(graph_api_key: str, output_file: str = 'active_indexers.json', use_cached_ens: bool = False, contract_address: Optional[str] = None, quicknode_url: Optional[str] = None) -> bool:
+def retrieveActiveIndexers(graph_api_key: str, output_file: str = 'active_indexers.json', use_cached_ens: bool = False, contract_address: Optional[str] = None, quicknode_url: Optional[str] = None) -> Optional[dict]:
     """
     Retrieve the list of active indexers with self stake > 0 from The Graph's network subgraph.
     ENS resolution can be cached or fetched from subgraph based on use_cached_ens parameter.
@@ -361,7 +826,7 @@ def retrieveActiveIndexers(graph_api_key: str, output_file: str = 'active_indexe
         quicknode_url: QuickNode RPC endpoint URL
         
     Returns:
-        True if successful, False otherwise
+        The data written to output_file, or None if an error occurred
     """
     try:
         # The Graph Network subgraph deployment ID
@@ -388,27 +853,26 @@ def retrieveActiveIndexers(graph_api_key: str, output_file: str = 'active_indexe
         print(f"Querying network subgraph for active indexers...")
         
         # Make the GraphQL request to network subgraph
-        response = requests.post(
+        response = get_session().post(
             network_url,
             json={"query": indexers_query},
-            headers={"Content-Type": "application/json"},
             timeout=30
         )
         response.raise_for_status()
         
-        data = response.json()
+        data = json_loads(response.content)
         
         # Check for errors in the response
         if "errors" in data:
             print(f"GraphQL Error: {data['errors']}")
-            return False
+            return None
         
         # Extract indexers from the response
         indexers_raw = data.get("data", {}).get("indexers", [])
         
         if not indexers_raw:
             print("No active indexers found with self stake > 0")
-            return False
+            return None
         
         print(f"✓ Retrieved {len(indexers_raw)} active indexers")
         
@@ -428,73 +892,109 @@ def retrieveActiveIndexers(graph_api_key: str, output_file: str = 'active_indexe
                 use_cached_ens = False
         
         if not use_cached_ens:
+            # Names looked up less than ENS_CACHE_TTL ago are reused from the cache; only
+            # addresses that are new or stale are sent to the ENS subgraph
+            now = time.time()
+            cached_ens, cached_resolved_at = load_ens_cache_entries()
+            cached_ens = cached_ens or {}
+            resolved_at = {}
+            stale_addresses = []
+            
+            for address in addresses:
+                looked_up = cached_resolved_at.get(address)
+                if isinstance(looked_up, (int, float)) and now - looked_up < ENS_CACHE_TTL:
+                    resolved_at[address] = looked_up
+                    if cached_ens.get(address):
+                        ens_mapping[address] = cached_ens[address]
+                else:
+                    stale_addresses.append(address)
+            
+            def keep_cached_names(batch_addresses: List[str]) -> None:
+                # A failed batch keeps its previous names and is retried on the next run
+                for address in batch_addresses:
+                    if cached_ens.get(address):
+                        ens_mapping[address] = cached_ens[address]
+            
             # Query ENS subgraph to resolve names
-            print(f"Querying ENS subgraph for name resolution...")
+            print(f"Querying ENS subgraph for {len(stale_addresses)} of {len(addresses)} addresses "
+                  f"({len(addresses) - len(stale_addresses)} cached)...")
             
             # Build ENS query - query in batches if needed
             batch_size = 100
             
-            for i in range(0, len(addresses), batch_size):
-                batch_addresses = addresses[i:i+batch_size]
-                
-                # Build the where clause for this batch
-                addresses_filter = '", "'.join(batch_addresses)
-                ens_query = f"""
-                {{
-                  domains(first: 1000, where: {{resolvedAddress_in: ["{addresses_filter}"]}}) {{
-                    name
-                    resolvedAddress {{
-                      id
-                    }}
-                  }}
-                }}
-                """
-                
+            # The query text is the same for every batch; each batch only sends its
+            # addresses as a GraphQL variable
+            ens_query = """
+            query ($addresses: [String!]!) {
+              domains(first: 1000, where: {resolvedAddress_in: $addresses}) {
+                name
+                resolvedAddress {
+                  id
+                }
+              }
+            }
+            """
+            
+            def fetch_ens_batch(batch_number: int, batch_addresses: List[str]) -> Tuple[Optional[list], Optional[str]]:
+                """Query the ENS subgraph for one batch; returns (domains, error message)."""
                 try:
-                    ens_response = requests.post(
+                    ens_response = get_session().post(
                         ens_url,
-                        json={"query": ens_query},
-                        headers={"Content-Type": "application/json"},
+                        json={"query": ens_query, "variables": {"addresses": batch_addresses}},
                         timeout=30
                     )
                     ens_response.raise_for_status()
                     
-                    ens_data = ens_response.json()
+                    ens_data = json_loads(ens_response.content)
                     
                     if "errors" in ens_data:
-                        print(f"⚠ ENS query error for batch {i//batch_size + 1}: {ens_data['errors']}")
-                        continue
+                        return None, f"ENS query error for batch {batch_number}: {ens_data['errors']}"
                     
-                    # Map addresses to ENS names
-                    domains = ens_data.get("data", {}).get("domains", [])
-                    for domain in domains:
-                        resolved_addr = domain.get("resolvedAddress", {})
-                        if resolved_addr:
-                            addr_id = resolved_addr.get("id", "").lower()
-                            ens_name = domain.get("name", "")
-                            if addr_id and ens_name:
-                                ens_mapping[addr_id] = ens_name
+                    return ens_data.get("data", {}).get("domains", []), None
                     
                 except Exception as e:
-                    print(f"⚠ Error querying ENS for batch {i//batch_size + 1}: {e}")
+                    return None, f"Error querying ENS for batch {batch_number}: {e}"
+            
+            batches = [stale_addresses[i:i+batch_size] for i in range(0, len(stale_addresses), batch_size)]
+            
+            # The batches are independent, so they are sent concurrently and merged
+            # back in order once they have all returned
+            with ThreadPoolExecutor(max_workers=min(RPC_MAX_WORKERS, len(batches)) or 1) as executor:
+                results = list(executor.map(fetch_ens_batch, range(1, len(batches) + 1), batches))
+            
+            for batch_addresses, (domains, error) in zip(batches, results):
+                if error is not None:
+                    print(f"⚠ {error}")
+                    keep_cached_names(batch_addresses)
                     continue
+                
+                # Map addresses to ENS names
+                for domain in domains:
+                    resolved_addr = domain.get("resolvedAddress", {})
+                    if resolved_addr:
+                        addr_id = resolved_addr.get("id", "").lower()
+                        ens_name = domain.get("name", "")
+                        if addr_id and ens_name:
+                            ens_mapping[addr_id] = ens_name
+                
+                # Addresses without a name are recorded too, so they aren't retried every run
+                for address in batch_addresses:
+                    resolved_at[address] = now
             
             print(f"✓ Resolved {len(ens_mapping)} ENS names")
             
             # Save ENS cache for future use
-            save_ens_cache(ens_mapping)
+            save_ens_cache(ens_mapping, resolved_at=resolved_at)
         
         # Build the JSON structure (without ENS names)
-        current_timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
+        current_timestamp = datetime.now(timezone.utc).strftime(_METADATA_TS_FMT)
         
         # Get oracle update time and eligibility period from contract if available
         last_oracle_update_time = None
         eligibility_period = None
         if contract_address and quicknode_url:
-            print(f"Fetching last oracle update time from contract...")
-            last_oracle_update_time = get_oracle_update_time(contract_address, quicknode_url)
-            print(f"Fetching eligibility period from contract...")
-            eligibility_period = get_eligibility_period(contract_address, quicknode_url)
+            print(f"Fetching last oracle update time and eligibility period from contract...")
+            last_oracle_update_time, eligibility_period = get_contract_parameters(contract_address, quicknode_url)
         
         output_data = {
             "metadata": {
@@ -532,180 +1032,174 @@ def retrieveActiveIndexers(graph_api_key: str, output_file: str = 'active_indexe
         
         # Write to JSON file
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2)
+            json_dump_pretty(output_data, f)
         
         print(f"✓ Results written to {output_file}")
-        return True
+        return output_data
         
     except requests.exceptions.RequestException as e:
         print(f"Request error querying subgraphs: {e}")
-        return False
+        return None
     except Exception as e:
         print(f"Error in retrieveActiveIndexers: {e}")
-        return False
+        return None
 
 
-def checkEligibility(contract_address: str, quicknode_url: str, input_file: str = 'active_indexers.json') -> bool:
+def checkEligibility(contract_address: str, quicknode_url: str, input_file: str = 'active_indexers.json',
+                     batch_size: int = RPC_BATCH_SIZE, data: Optional[dict] = None) -> bool:
     """
-    Check eligibility for each indexer using a two-pass approach:
-    1. First pass: Call isEligible(address) for all indexers and store the result
-    2. Second pass: Only for eligible indexers, call getEligibilityRenewalTime(address)
+    Check eligibility for each indexer in three passes:
+    1. First pass: Call isEligible(address) for all indexers and store the result, and
+       getEligibilityRenewalTime(address) for those whose renewal time isn't cached
+    2. Second pass: Only for eligible indexers, set the renewal time read (or reused
+       from the cache) in the first pass; no contract calls are made
+    3. Third pass: Set each indexer's status from its renewal time, the last oracle
+       update time and the eligibility period
     
     Reads indexer addresses from the JSON file and updates each indexer's is_eligible 
-    and eligibility_renewal_time fields.
+    and eligibility_renewal_time fields. The calls are bundled into Multicall3
+    aggregate3() eth_calls of MULTICALL_CHUNK_SIZE calls, so the contract reads cost one
+    round trip per chunk; a chunk whose aggregate call fails is sent as JSON-RPC batches
+    of plain eth_calls instead.
     
     Args:
         contract_address: The contract address (0x9BED32d2b562043a426376b99d289fE821f5b04E)
         quicknode_url: QuickNode RPC endpoint URL
         input_file: Path to the active_indexers.json file
+        batch_size: Maximum number of eth_calls per JSON-RPC batch request when a chunk
+                    falls back to plain eth_calls
+        data: Contents of input_file if already in memory (e.g. as returned by
+              retrieveActiveIndexers), so the file isn't read back; read from disk if None
         
     Returns:
         True if successful, False otherwise
     """
     try:
-        # Check if input file exists
-        if not os.path.exists(input_file):
-            print(f"⚠ {input_file} not found, skipping eligibility check")
-            return False
-        
-        # Read the JSON file
-        print(f"Reading indexer data from {input_file}...")
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if data is None:
+            # Check if input file exists
+            if not os.path.exists(input_file):
+                print(f"⚠ {input_file} not found, skipping eligibility check")
+                return False
+            
+            # Read the JSON file
+            print(f"Reading indexer data from {input_file}...")
+            with open(input_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         
         indexers = data.get("indexers", [])
         if not indexers:
             print("No indexers found in JSON file")
             return False
         
+        def run_direct_calls(calldatas: List[str]) -> List[Optional[Any]]:
+            """Send each calldata to the contract as its own eth_call, batch_size calls per request."""
+            calls = [("eth_call", [{"to": contract_address, "data": calldata}, "latest"]) for calldata in calldatas]
+            results: List[Optional[Any]] = []
+            for start in range(0, len(calls), batch_size):
+                results.extend(rpc_batch(quicknode_url, calls[start:start + batch_size]))
+            return results
+        
+        def run_calls_chunk(calldatas: List[str]) -> List[Optional[Any]]:
+            # One Multicall3 eth_call for the whole chunk; if the aggregate call fails
+            # (e.g. no Multicall3 on this chain) the chunk is sent as plain eth_calls
+            results = rpc_multicall(quicknode_url, contract_address, calldatas)
+            if results is None:
+                print(f"⚠ Multicall3 call failed, sending {len(calldatas)} calls directly")
+                results = run_direct_calls(calldatas)
+            return results
+        
+        def run_calls(calldatas: List[str], label: str) -> List[Optional[Any]]:
+            """Send each calldata to the contract, MULTICALL_CHUNK_SIZE calls per eth_call."""
+            chunks = [calldatas[start:start + MULTICALL_CHUNK_SIZE]
+                      for start in range(0, len(calldatas), MULTICALL_CHUNK_SIZE)]
+            
+            # The chunks are independent, so up to RPC_MAX_WORKERS of them are in
+            # flight at once over the shared keep-alive session; map() keeps them in order
+            results: List[Optional[Any]] = []
+            with ThreadPoolExecutor(max_workers=min(RPC_MAX_WORKERS, len(chunks)) or 1) as executor:
+                for chunk_results in executor.map(run_calls_chunk, chunks):
+                    results.extend(chunk_results)
+                    print(f"  Processed {len(results)}/{len(calldatas)} {label}...")
+            return results
+        
+        # Renewal times are only written by the oracle, so while its last update time
+        # matches the one they were read at, the previous run's values are still current
+        # (isEligible itself also depends on the clock, so it is always called)
+        oracle_update_time = data.get("metadata", {}).get("last_oracle_update_time")
+        cache_key = f"renewal_times:{contract_address.lower()}"
+        cached = load_cached(cache_key, RENEWAL_TIMES_CACHE_TTL) if oracle_update_time is not None else None
+        cached_times = {}
+        if isinstance(cached, dict) and cached.get("oracle_update_time") == oracle_update_time:
+            cached_times = cached.get("renewal_times") or {}
+        
         # ========== PASS 1: Check isEligible for all indexers ==========
         print(f"Pass 1: Checking isEligible status for {len(indexers)} indexers...")
         
-        # Function selector for isEligible(address)
-        # From contract: 0x66e305fd
-        is_eligible_selector = '0x66e305fd'
+        # ABI-encode each address argument once for both calls
+        checked = [
+            (indexer, _abi_address(address))
+            for indexer in indexers
+            if (address := indexer.get("address", ""))
+        ]
+        
+        # Renewal times that aren't cached are read in the same Multicall3 calls as
+        # isEligible, for every indexer: the extra reads cost far less than a second
+        # round of requests for the eligible ones once their status is known
+        renewal_times = {}
+        uncached = []
+        for indexer, encoded_address in checked:
+            address_lower = indexer["address"].lower()
+            if isinstance(cached_times.get(address_lower), int):
+                renewal_times[address_lower] = cached_times[address_lower]
+            else:
+                uncached.append((indexer, encoded_address))
         
+        calldatas = ([SEL_IS_ELIGIBLE + encoded_address for _, encoded_address in checked] +
+                     [SEL_RENEWAL_TIME + encoded_address for _, encoded_address in uncached])
+        results = run_calls(calldatas, "calls")
         eligible_count = 0
         
-        # First pass: Check isEligible for each indexer
-        for i, indexer in enumerate(indexers):
-            address = indexer.get("address", "")
-            if not address:
-                continue
-            
+        # Failed or reverted calls come back as None
+        for (indexer, _), result in zip(checked, results[:len(checked)]):
             try:
-                # Prepare the function call data
-                # Remove '0x' prefix from address and pad to 32 bytes (64 hex chars)
-                address_param = address[2:] if address.startswith('0x') else address
-                address_param = address_param.lower().zfill(64)
-                
-                data_payload = is_eligible_selector + address_param
-                
-                # Make the eth_call
-                payload = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "eth_call",
-                    "params": [
-                        {
-                            "to": contract_address,
-                            "data": data_payload
-                        },
-                        "latest"
-                    ]
-                }
-                
-                response = requests.post(quicknode_url, json=payload, timeout=10)
-                response.raise_for_status()
-                
-                result = response.json()
-                
-                if "result" in result and result["result"] != "0x":
-                    # Parse the result (bool)
-                    # The result is a 32-byte hex string, bool is the last byte
-                    is_eligible = int(result["result"], 16) != 0
-                    indexer["is_eligible"] = is_eligible
-                    if is_eligible:
-                        eligible_count += 1
-                else:
-                    indexer["is_eligible"] = False
-                
-            except Exception as e:
-                print(f"⚠ Error checking isEligible for {address}: {e}")
-                indexer["is_eligible"] = False
-                continue
+                # The result is a 32-byte hex string, bool is the last byte
+                is_eligible = result not in (None, "0x") and int(result, 16) != 0
+            except (TypeError, ValueError) as e:
+                print(f"⚠ Error checking isEligible for {indexer['address']}: {e}")
+                is_eligible = False
             
-            # Progress indicator every 10 indexers
-            if (i + 1) % 10 == 0:
-                print(f"  Processed {i + 1}/{len(indexers)} indexers...")
+            indexer["is_eligible"] = is_eligible
+            if is_eligible:
+                eligible_count += 1
+        
+        for (indexer, _), result in zip(uncached, results[len(checked):]):
+            try:
+                # Parse the result (uint256 timestamp)
+                if result not in (None, "0x"):
+                    renewal_times[indexer["address"].lower()] = int(result, 16)
+            except (TypeError, ValueError) as e:
+                print(f"⚠ Error getting renewal time for {indexer['address']}: {e}")
         
         print(f"✓ Pass 1 complete: {eligible_count} eligible indexers found")
         
-        # ========== PASS 2: Get renewal times for eligible indexers ==========
-        print(f"Pass 2: Getting eligibility renewal times for {eligible_count} eligible indexers...")
+        # ========== PASS 2: Set renewal times for eligible indexers ==========
+        print(f"Pass 2: Applying the renewal times read in pass 1 to {eligible_count} eligible indexers...")
         
-        # Function selector for getEligibilityRenewalTime(address)
-        # From contract: 0xd353402d
-        renewal_time_selector = '0xd353402d'
+        if len(uncached) < len(checked):
+            print(f"  Reused {len(checked) - len(uncached)} renewal times cached at oracle update {oracle_update_time}")
         
+        # Ineligible indexers (and failed reads) get 0
         updated_count = 0
-        processed_count = 0
-        
-        # Second pass: Get renewal time only for eligible indexers
-        for i, indexer in enumerate(indexers):
-            # Skip if not eligible
-            if not indexer.get("is_eligible", False):
-                indexer["eligibility_renewal_time"] = 0
-                continue
-            
-            address = indexer.get("address", "")
-            if not address:
-                continue
-            
-            try:
-                # Prepare the function call data
-                address_param = address[2:] if address.startswith('0x') else address
-                address_param = address_param.lower().zfill(64)
-                
-                data_payload = renewal_time_selector + address_param
-                
-                # Make the eth_call
-                payload = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "eth_call",
-                    "params": [
-                        {
-                            "to": contract_address,
-                            "data": data_payload
-                        },
-                        "latest"
-                    ]
-                }
-                
-                response = requests.post(quicknode_url, json=payload, timeout=10)
-                response.raise_for_status()
-                
-                result = response.json()
-                
-                if "result" in result and result["result"] != "0x":
-                    # Parse the result (uint256 timestamp)
-                    renewal_time = int(result["result"], 16)
-                    indexer["eligibility_renewal_time"] = renewal_time
-                    updated_count += 1
-                else:
-                    indexer["eligibility_renewal_time"] = 0
-                
-            except Exception as e:
-                print(f"⚠ Error getting renewal time for {address}: {e}")
+        for indexer in indexers:
+            renewal_time = renewal_times.get(indexer.get("address", "").lower())
+            if indexer.get("is_eligible", False) and renewal_time is not None:
+                indexer["eligibility_renewal_time"] = renewal_time
+                updated_count += 1
+            else:
                 indexer["eligibility_renewal_time"] = 0
-                continue
-            
-            processed_count += 1
-            
-            # Progress indicator every 10 eligible indexers
-            if processed_count % 10 == 0:
-                print(f"  Processed {processed_count}/{eligible_count} eligible indexers...")
+        
+        if oracle_update_time is not None and uncached:
+            store_cached(cache_key, {"oracle_update_time": oracle_update_time, "renewal_times": renewal_times})
         
         print(f"✓ Pass 2 complete: {updated_count} renewal times updated")
         
@@ -723,6 +1217,7 @@ def checkEligibility(contract_address: str, quicknode_url: str, input_file: str
         eligible_status_count = 0
         grace_status_count = 0
         ineligible_status_count = 0
+        readable_until = {}
         
         for indexer in indexers:
             eligibility_renewal_time = indexer.get("eligibility_renewal_time", 0)
@@ -740,9 +1235,12 @@ def checkEligibility(contract_address: str, quicknode_url: str, input_file: str
                 if current_time < grace_period_end:
                     indexer["status"] = "grace"
                     indexer["eligible_until"] = grace_period_end
-                    # Format: 2-Nov-2025 at 19:25:55 UTC (day without leading zero)
-                    dt = datetime.fromtimestamp(grace_period_end, tz=timezone.utc)
-                    indexer["eligible_until_readable"] = dt.strftime("%-d-%b-%Y at %H:%M:%S UTC")
+                    # Grace indexers share a few renewal times, so each end date is formatted once
+                    readable = readable_until.get(grace_period_end)
+                    if readable is None:
+                        readable = datetime.fromtimestamp(grace_period_end, tz=timezone.utc).strftime(_ELIGIBLE_UNTIL_FMT)
+                        readable_until[grace_period_end] = readable
+                    indexer["eligible_until_readable"] = readable
                     grace_status_count += 1
                 else:
                     indexer["status"] = "ineligible"
@@ -762,7 +1260,7 @@ def checkEligibility(contract_address: str, quicknode_url: str, input_file: str
         
         # Write updated data back to JSON file
         with open(input_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+            json_dump_pretty(data, f)
         
         print(f"✓ Eligibility check complete:")
         print(f"  - Total indexers: {len(indexers)}")
@@ -856,7 +1354,7 @@ def updateStatusChangeDates(current_file: str = 'active_indexers.json', previous
         
         # Write updated data back to current file
         with open(current_file, 'w', encoding='utf-8') as f:
-            json.dump(current_data, f, indent=2)
+            json_dump_pretty(current_data, f)
         
         print(f"✓ Status change detection complete:")
         print(f"  - Status changed: {status_changed_count}")
@@ -927,7 +1425,7 @@ def logStatusChanges(current_file: str = 'active_indexers.json', previous_file:
                 activity_log = {"metadata": {}, "status_changes": []}
         
         # Update metadata section (always overwrite)
-        current_check = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
+        current_check = datetime.now(timezone.utc).strftime(_METADATA_TS_FMT)
         last_oracle_update_time = current_metadata.get("last_oracle_update_time")
         
         activity_log["metadata"] = {
@@ -961,7 +1459,7 @@ def logStatusChanges(current_file: str = 'active_indexers.json', previous_file:
         
         # Write updated activity log back to file
         with open(log_file, 'w', encoding='utf-8') as f:
-            json.dump(activity_log, f, indent=2)
+            json_dump_pretty(activity_log, f)
         
         print(f"✓ Activity log updated:")
         print(f"  - Last check: {current_check}")
@@ -985,26 +1483,58 @@ def read_indexers_data(filename: str = 'indexers.txt') -> List[Tuple[str, str]]:
     Returns:
         List of tuples containing (address, ens_name)
     """
-    indexers = []
-    
     if not os.path.exists(filename):
         print(f"Error: {filename} not found!")
         return []
     
-    with open(filename, 'r', encoding='utf-8') as file:
-        for line_num, line in enumerate(file, 1):
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Split by comma, handle empty ENS names
-            parts = line.split(',', 1)
-            if len(parts) == 2:
-                address, ens_name = parts
-                indexers.append((address.strip(), ens_name.strip()))
-            else:
-                # Handle case where there's no comma (just address)
-                indexers.append((line.strip(), ''))
+    with open(filename, 'rb') as file:
+        try:
+            # Map the file and parse the bytes in place instead of going through
+            # the buffered text reader
+            mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # mmap refuses empty (and some special) files, fall back to a plain read
+            return _parse_indexer_lines(file.read().splitlines(), filename)
+        
+        try:
+            return _parse_indexer_lines(iter(mm.readline, b''), filename)
+        finally:
+            mm.close()
+
+
+# Ethereum address: 0x followed by exactly 40 hex digits (matched against raw bytes)
+_ADDR_RE = re.compile(rb'\A0x[0-9a-fA-F]{40}\Z')
+
+
+def _parse_indexer_lines(lines: Iterable[bytes], filename: str = 'indexers.txt') -> List[Tuple[str, str]]:
+    """
+    Parse raw 'address,ens_name' lines into (address, ens_name) tuples.
+    
+    Rows whose address isn't 0x + 40 hex digits are skipped with a warning; only the
+    fields of the remaining rows are decoded.
+    
+    Args:
+        lines: Iterable of raw lines as bytes
+        filename: Name of the file the lines come from, used in warnings
+        
+    Returns:
+        List of tuples containing (address, ens_name)
+    """
+    indexers = []
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        
+        # partition() always returns a 3-tuple, so a line without a comma (just an
+        # address) yields an empty ENS name without a separate length check
+        address, _, ens_name = line.partition(b',')
+        address = address.strip()
+        if not _ADDR_RE.match(address):
+            print(f"⚠ Skipping line {line_number} of {filename}: invalid address {address.decode('utf-8', 'replace')!r}")
+            continue
+        
+        indexers.append((address.decode('ascii'), ens_name.strip().decode('utf-8')))
     
     return indexers
 
@@ -1076,760 +1606,182 @@ def renderIndexerTable(json_file: str = 'active_indexers.json') -> List[dict]:
         return []
 
 
-def generate_html_dashboard(indexers: List[Tuple[str, str]], contract_address: str, api_key: Optional[str] = None, quicknode_url: Optional[str] = None) -> str:
+# Tables with more rows than this only keep the visible window in the DOM
+VIRTUAL_SCROLL_THRESHOLD = 500
+
+
+def _asset_version(filename: str) -> str:
     """
-    Generate the HTML dashboard content.
+    Short content hash of a static asset shipped next to this script.
+    
+    Args:
+        filename: Asset file name, relative to the script directory
+        
+    Returns:
+        12-character blake2s hex digest of the file, or VERSION if it can't be read
+    """
+    try:
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), filename), 'rb') as f:
+            return hashlib.blake2s(f.read(), digest_size=6).hexdigest()
+    except OSError:
+        return VERSION
+
+
+# Stylesheet served next to index.html (like grt.png) so browsers can cache it
+# separately from the regenerated page; the ?v= content hash changes whenever the
+# file does, so a stale cached copy is never paired with a newer page
+_CSS_LINK = f'<link rel="stylesheet" href="dashboard.css?v={_asset_version("dashboard.css")}">'
+
+# Page script, served next to index.html in the same way; it is deferred, so it
+# runs once the document (including the inline data script) has been parsed
+_SCRIPT_TAG = f'<script src="dashboard.js?v={_asset_version("dashboard.js")}" defer></script>'
+
+# Static page skeleton, built once at import time
+_TEMPLATE_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Eligibility Dashboard</title>
+    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600&display=swap" rel="stylesheet">
+    """ + _CSS_LINK + """
+</head>
+<body>
+"""
+
+_TEMPLATE_FOOTER = f"""    
+    <div class="footer">
+        <div class="footer-content">
+            <div class="footer-top">
+                <div class="footer-left">
+                    <svg class="bell-icon" viewBox="0 0 24 24" fill="currentColor"><path d="M12 22c1.1 0 2-.9 2-2h-4c0 1.1.9 2 2 2zm6-6v-5c0-3.07-1.63-5.64-4.5-6.32V4c0-.83-.67-1.5-1.5-1.5s-1.5.67-1.5 1.5v.68C7.64 5.36 6 7.92 6 11v5l-2 2v1h16v-1l-2-2zm-2 1H8v-6c0-2.48 1.51-4.5 4-4.5s4 2.02 4 4.5v6z"/></svg><a href="https://t.me/reo_dashboard_bot" target="_blank">Subscribe to real-time notifications on Telegram</a>
+                </div>
+                <div class="footer-right">
+                    <span class="version">v{VERSION}</span>
+                    <span class="footer-separator">-</span>
+                    <svg class="github-icon" viewBox="0 0 16 16" fill="currentColor"><path d="M8 0C3.58 0 0 3.58 0 8c0 3.54 2.29 6.53 5.47 7.59.4.07.55-.17.55-.38 0-.19-.01-.82-.01-1.49-2.01.37-2.53-.49-2.69-.94-.09-.23-.48-.94-.82-1.13-.28-.15-.68-.52-.01-.53.63-.01 1.08.58 1.23.82.72 1.21 1.87.87 2.33.66.07-.52.28-.87.51-1.07-1.78-.2-3.64-.89-3.64-3.95 0-.87.31-1.59.82-2.15-.08-.2-.36-1.02.08-2.12 0 0 .67-.21 2.2.82.64-.18 1.32-.27 2-.27.68 0 1.36.09 2 .27 1.53-1.04 2.2-.82 2.2-.82.44 1.1.16 1.92.08 2.12.51.56.82 1.27.82 2.15 0 3.07-1.87 3.75-3.65 3.95.29.25.54.73.54 1.48 0 1.07-.01 1.93-.01 2.2 0 .21.15.46.55.38A8.013 8.013 0 0016 8c0-4.42-3.58-8-8-8z"/></svg><a href="https://github.com/pdiomede/reo-dashboard" target="_blank">View repo on GitHub</a>
+                </div>
+            </div>
+        </div>
+    </div>
+    
+    <!-- Contract Information Section - Commented out as requested -->
+    """
+
+_TEMPLATE_TAIL = """
+</body>
+</html>"""
+
+# External-link icon shown after each indexer address
+_EXTERNAL_LINK_SVG = '<svg class="external-link-icon" viewBox="0 0 16 16" fill="currentColor"><path d="M14 2.5a.5.5 0 0 0-.5-.5h-6a.5.5 0 0 0 0 1h4.793L8.146 7.146a.5.5 0 0 0 .708.708L13 3.707V8.5a.5.5 0 0 0 1 0v-6z"/><path d="M4.5 4a.5.5 0 0 0-.5.5v8a.5.5 0 0 0 .5.5h8a.5.5 0 0 0 .5-.5V9a.5.5 0 0 0-1 0v3H5V5h3a.5.5 0 0 0 0-1h-3.5z"/></svg>'
+
+
+# Empty row cloned by the page script for every row it renders
+_ROW_TEMPLATE = """    <template id="rowTemplate">
+        <tr>
+            <td><a target="_blank" class="address-link"><span class="address"></span>""" + _EXTERNAL_LINK_SVG + """</a></td>
+            <td><span></span></td>
+            <td><span class="legend-badge"></span></td>
+            <td></td>
+        </tr>
+    </template>
+"""
+
+
+# Translation table that turns JSON text into the body of a single-quoted JS
+# string literal inside a <script> block, applied in a single C-level
+# str.translate pass: backslashes and quotes are escaped for the literal, and
+# the HTML-significant characters become JS escapes so a value can never close
+# the tag (json.dumps' default ensure_ascii already escapes line separators)
+_SCRIPT_JSON_TRANS = str.maketrans({
+    '\\': '\\\\',
+    "'": "\\'",
+    '<': '\\u003c',
+    '>': '\\u003e',
+    '&': '\\u0026',
+})
+
+
+def stream_html_dashboard(indexers: List[Tuple[str, str]], out: TextIO, contract_address: str, api_key: Optional[str] = None, quicknode_url: Optional[str] = None,
+                          contract_parameters: Optional[Tuple[Optional[int], Optional[int]]] = None) -> None:
+    """
+    Generate the HTML dashboard and write it to a text stream chunk by chunk,
+    so the complete page never has to be held in memory.
     
     Args:
         indexers: List of (address, ens_name) tuples (legacy parameter, not used)
+        out: Writable text stream (e.g. an open file) receiving the HTML
         contract_address: The Sepolia contract address
         api_key: Arbiscan API key
-        
-    Returns:
-        Complete HTML content as string
+        quicknode_url: QuickNode RPC endpoint URL
+        contract_parameters: (last oracle update time, eligibility period) already read
+                             this run, e.g. from retrieveActiveIndexers' metadata; read
+                             from the contract if None
     """
-    current_time = datetime.now(timezone.utc).strftime("%d %b %Y at %H:%M (UTC)")
+    current_time = time.strftime("%d %b %Y at %H:%M (UTC)", time.gmtime())
     
     # Load all indexers from JSON file
     print("Loading indexers for dashboard...")
     all_indexers = renderIndexerTable()
     
-    # Fetch last transaction data
-    print("Fetching last transaction data...")
-    last_transaction: Optional[dict] = None
-    
-    # First, try to load from local JSON file
-    last_transaction = get_last_transaction_from_json()
-    
-    # If no local data, try QuickNode if available
-    if not last_transaction and quicknode_url:
-        last_transaction = get_last_transaction_via_quicknode(contract_address, quicknode_url)
-    
-    # Final fallback to Arbiscan API
-    if not last_transaction:
-        last_transaction = get_last_transaction(contract_address, api_key)
-    
-    # Save transaction data with script run timestamp
-    if last_transaction:
-        save_transaction_to_json(last_transaction)
+    def fetch_last_transaction() -> Optional[dict]:
+        print("Fetching last transaction data...")
+        
+        # First, try to load from local JSON file
+        last_transaction = get_last_transaction_from_json()
+        
+        # If no local data, try QuickNode if available
+        if not last_transaction and quicknode_url:
+            last_transaction = get_last_transaction_via_quicknode(contract_address, quicknode_url)
+        
+        # Final fallback to Arbiscan API
+        if not last_transaction:
+            last_transaction = get_last_transaction(contract_address, api_key)
+        
+        # Save transaction data with script run timestamp
+        if last_transaction:
+            save_transaction_to_json(last_transaction)
+        return last_transaction
     
-    # Fetch oracle update time from contract
-    print("Fetching oracle update time from contract...")
-    oracle_update_time: Optional[int] = None
-    if quicknode_url:
-        oracle_update_time = get_oracle_update_time(contract_address, quicknode_url)
+    def fetch_contract_parameters() -> Tuple[Optional[int], Optional[int]]:
+        # Oracle update time and eligibility period from contract (one batched request)
+        print("Fetching oracle update time and eligibility period from contract...")
+        if not quicknode_url:
+            return None, None
+        return get_contract_parameters(contract_address, quicknode_url)
     
-    # Fetch eligibility period from contract
-    print("Fetching eligibility period from contract...")
-    eligibility_period: Optional[int] = None
-    if quicknode_url:
-        eligibility_period = get_eligibility_period(contract_address, quicknode_url)
+    if contract_parameters is not None:
+        last_transaction: Optional[dict] = fetch_last_transaction()
+        oracle_update_time, eligibility_period = contract_parameters
+    else:
+        # The two lookups are independent network round-trips, so run them side by side
+        # (both go through the shared session's connection pool)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            transaction_future = executor.submit(fetch_last_transaction)
+            parameters_future = executor.submit(fetch_contract_parameters)
+            last_transaction = transaction_future.result()
+            oracle_update_time, eligibility_period = parameters_future.result()
     
-    html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Eligibility Dashboard</title>
-    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600&display=swap" rel="stylesheet">
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Poppins', 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: #0C0A1D;
-            min-height: 100vh;
-            padding: 20px;
-        }}
-        
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: #0C0A1D;
-            border-radius: 15px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.3);
-            overflow: hidden;
-            border: 1px solid #9CA3AF;
-        }}
-        
-        .header {{
-            background: #0C0A1D;
-            color: #F8F6FF;
-            padding: 30px;
-            border-bottom: 1px solid #9CA3AF;
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-        }}
-        
-        .title-container {{
-            display: flex;
-            align-items: center;
-            gap: 15px;
-        }}
-        
-        .header-icon {{
-            width: 50px;
-            height: 50px;
-            object-fit: contain;
-        }}
-        
-        .header h1 {{
-            font-size: 2.2em;
-            margin: 0;
-            font-weight: 300;
-        }}
-        
-        .header .subtitle {{
-            font-size: 0.95em;
-            opacity: 0.9;
-            font-weight: 300;
-            white-space: nowrap;
-        }}
-        
-        .search-container {{
-            padding: 25px 30px;
-            background: #0C0A1D;
-            border-bottom: 1px solid #9CA3AF;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            gap: 20px;
-            flex-wrap: wrap;
-        }}
-        
-        .search-wrapper {{
-            flex: 0 0 45%;
-            min-width: 300px;
-            max-width: 500px;
-        }}
-        
-        .search-box {{
-            width: 100%;
-            padding: 15px 20px;
-            border: 2px solid #9CA3AF;
-            border-radius: 25px;
-            font-size: 16px;
-            outline: none;
-            transition: all 0.3s ease;
-            background: #0C0A1D;
-            color: #F8F6FF;
-        }}
-        
-        .search-box:focus {{
-            border-color: #F8F6FF;
-            box-shadow: 0 0 0 3px rgba(248, 246, 255, 0.1);
-        }}
-        
-        .search-box::placeholder {{
-            color: #9CA3AF;
-        }}
-        
-        .filter-wrapper {{
-            display: flex;
-            align-items: center;
-            gap: 10px;
-            flex-wrap: wrap;
-        }}
-        
-        .legend {{
-            padding: 20px 30px;
-            background: #0C0A1D;
-            border-bottom: 1px solid #9CA3AF;
-        }}
-        
-        .legend-title {{
-            color: #F8F6FF;
-            font-size: 14px;
-            font-weight: 600;
-            margin-bottom: 10px;
-            text-align: center;
-        }}
-        
-        .legend-items {{
-            display: flex;
-            gap: 20px;
-            flex-wrap: wrap;
-            justify-content: center;
-        }}
-        
-        .legend-item {{
-            display: flex;
-            align-items: center;
-            gap: 8px;
-            font-size: 13px;
-        }}
-        
-        .legend-badge {{
-            padding: 4px 12px;
-            border-radius: 12px;
-            font-weight: 500;
-            font-size: 11px;
-        }}
-        
-        .legend-badge.good {{
-            background: rgba(34, 197, 94, 0.2);
-            color: #22c55e;
-            border: 1px solid #22c55e;
-        }}
-        
-        .legend-badge.grace {{
-            background: rgba(251, 191, 36, 0.2);
-            color: #fbbf24;
-            border: 1px solid #fbbf24;
-        }}
-        
-        .legend-badge.ineligible {{
-            background: rgba(239, 68, 68, 0.2);
-            color: #ef4444;
-            border: 1px solid #ef4444;
-        }}
-        
-        .legend-description {{
-            color: #9CA3AF;
-        }}
-        
-        .gip-banner {{
-            padding: 15px 30px;
-            background: #0C0A1D;
-            border-bottom: 1px solid #9CA3AF;
-            text-align: center;
-            font-size: 14px;
-            color: #9CA3AF;
-        }}
-        
-        .gip-banner a {{
-            color: #9CA3AF;
-            text-decoration: none;
-            transition: color 0.3s ease;
-        }}
-        
-        .gip-banner a:hover {{
-            color: #F8F6FF;
-            text-decoration: underline;
-        }}
-        
-        .counters-section {{
-            padding: 25px 30px;
-            background: #0C0A1D;
-            border-bottom: 1px solid #9CA3AF;
-            display: flex;
-            justify-content: space-around;
-            align-items: center;
-            flex-wrap: wrap;
-            gap: 20px;
-        }}
-        
-        .counter-item {{
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            gap: 8px;
-        }}
-        
-        .counter-label {{
-            color: #9CA3AF;
-            font-size: 14px;
-            font-weight: 500;
-            text-align: center;
-        }}
-        
-        .counter-value {{
-            color: #F8F6FF;
-            font-size: 32px;
-            font-weight: 600;
-            text-align: center;
-        }}
-        
-        .counter-value.eligible-count {{
-            color: #22c55e;
-        }}
-        
-        .counter-value.grace-count {{
-            color: #eab308;
-        }}
-        
-        .counter-value.ineligible-count {{
-            color: #ef4444;
-        }}
-        
-        .filter-label {{
-            color: #9CA3AF;
-            font-size: 14px;
-            font-weight: 500;
-            margin-right: 5px;
-        }}
-        
-        .filter-btn {{
-            padding: 6px 14px;
-            border-radius: 12px;
-            font-weight: 500;
-            font-size: 12px;
-            border: none;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            position: relative;
-        }}
-        
-        .filter-btn:hover {{
-            opacity: 0.8;
-            transform: translateY(-1px);
-        }}
-        
-        .filter-btn[data-tooltip]::after {{
-            content: attr(data-tooltip);
-            position: absolute;
-            bottom: 100%;
-            left: 50%;
-            transform: translateX(-50%);
-            margin-bottom: 8px;
-            padding: 8px 12px;
-            background: #1a1825;
-            color: #F8F6FF;
-            font-size: 12px;
-            font-weight: 400;
-            white-space: nowrap;
-            border-radius: 6px;
-            opacity: 0;
-            pointer-events: none;
-            transition: opacity 0.2s ease;
-            border: 1px solid #9CA3AF;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.3);
-            z-index: 1000;
-        }}
-        
-        .filter-btn[data-tooltip]:hover::after {{
-            opacity: 1;
-        }}
-        
-        .filter-btn[data-tooltip]::before {{
-            content: '';
-            position: absolute;
-            bottom: 100%;
-            left: 50%;
-            transform: translateX(-50%);
-            margin-bottom: 2px;
-            border: 6px solid transparent;
-            border-top-color: #9CA3AF;
-            opacity: 0;
-            pointer-events: none;
-            transition: opacity 0.2s ease;
-            z-index: 1000;
-        }}
-        
-        .filter-btn[data-tooltip]:hover::before {{
-            opacity: 1;
-        }}
-        
-        .filter-btn.eligible {{
-            background: rgba(34, 197, 94, 0.2);
-            color: #22c55e;
-            border: 1px solid #22c55e;
-        }}
-        
-        .filter-btn.eligible.active {{
-            background: #22c55e;
-            color: #0C0A1D;
-        }}
-        
-        .filter-btn.grace {{
-            background: rgba(251, 191, 36, 0.2);
-            color: #fbbf24;
-            border: 1px solid #fbbf24;
-        }}
-        
-        .filter-btn.grace.active {{
-            background: #fbbf24;
-            color: #0C0A1D;
-        }}
-        
-        .filter-btn.ineligible {{
-            background: rgba(239, 68, 68, 0.2);
-            color: #ef4444;
-            border: 1px solid #ef4444;
-        }}
-        
-        .filter-btn.ineligible.active {{
-            background: #ef4444;
-            color: #0C0A1D;
-        }}
-        
-        .filter-btn.reset {{
-            background: rgba(156, 163, 175, 0.2);
-            color: #9CA3AF;
-            border: 1px solid #9CA3AF;
-        }}
-        
-        .filter-btn.reset:hover {{
-            background: rgba(156, 163, 175, 0.3);
-        }}
-        
-        .table-container {{
-            padding: 0 30px 30px;
-            overflow-x: auto;
-        }}
-        
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 20px;
-            background: #0C0A1D;
-            border-radius: 10px;
-            overflow: hidden;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.3);
-            border: 1px solid #9CA3AF;
-        }}
-        
-        th {{
-            background: #0C0A1D;
-            color: #9CA3AF;
-            padding: 20px 15px;
-            text-align: left;
-            font-weight: 600;
-            font-size: 14px;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            cursor: pointer;
-            user-select: none;
-            position: relative;
-            border-bottom: 1px solid #9CA3AF;
-        }}
-        
-        th:hover {{
-            background: #1a1825;
-        }}
-        
-        th.sortable::after {{
-            content: ' ↕';
-            opacity: 0.5;
-            font-size: 12px;
-        }}
-        
-        th.sort-asc::after {{
-            content: ' ↑';
-            opacity: 1;
-        }}
-        
-        th.sort-desc::after {{
-            content: ' ↓';
-            opacity: 1;
-        }}
-        
-        td {{
-            padding: 18px 15px;
-            border-bottom: 1px solid #9CA3AF;
-            font-size: 14px;
-            color: #F8F6FF;
-        }}
-        
-        tr:hover {{
-            background-color: #1a1825;
-        }}
-        
-        tr:nth-child(even) {{
-            background-color: #0C0A1D;
-        }}
-        
-        tr:nth-child(even):hover {{
-            background-color: #1a1825;
-        }}
-        
-        .address {{
-            font-family: 'Courier New', monospace;
-            font-size: 13px;
-            color: #F8F6FF;
-            word-break: break-all;
-        }}
-        
-        .address-link {{
-            text-decoration: none;
-            transition: opacity 0.3s ease;
-            display: inline-flex;
-            align-items: center;
-            gap: 5px;
-        }}
-        
-        .address-link:hover .address {{
-            color: #9CA3AF;
-        }}
-        
-        .external-link-icon {{
-            width: 12px;
-            height: 12px;
-            opacity: 0.6;
-            transition: opacity 0.3s ease;
-        }}
-        
-        .address-link:hover .external-link-icon {{
-            opacity: 1;
-        }}
-        
-        .ens-name {{
-            color: #F8F6FF;
-            font-weight: 500;
-        }}
-        
-        .empty-ens {{
-            color: #9CA3AF;
-            font-style: italic;
-        }}
-        
-        .stats {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 20px 30px;
-            background: #0C0A1D;
-            border-top: 1px solid #9CA3AF;
-            font-size: 14px;
-            color: #F8F6FF;
-        }}
-        
-        .total-count {{
-            font-weight: 600;
-            color: #F8F6FF;
-        }}
-        
-        .filtered-count {{
-            color: #F8F6FF;
-        }}
-        
-        .contract-info {{
-            background: #0C0A1D;
-            border-top: 1px solid #9CA3AF;
-        }}
-        
-        .contract-info-header {{
-            padding: 25px 30px;
-            cursor: pointer;
-            user-select: none;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            transition: background 0.3s ease;
-        }}
-        
-        .contract-info-header:hover {{
-            background: #1a1825;
-        }}
-        
-        .contract-info h3 {{
-            color: #F8F6FF;
-            font-size: 1.3em;
-            margin: 0;
-            font-weight: 500;
-        }}
-        
-        .contract-info-arrow {{
-            width: 20px;
-            height: 20px;
-            transition: transform 0.3s ease;
-            color: #9CA3AF;
-        }}
-        
-        .contract-info-arrow.expanded {{
-            transform: rotate(180deg);
-        }}
-        
-        .contract-info-content {{
-            max-height: 0;
-            overflow: hidden;
-            transition: max-height 0.3s ease;
-            padding: 0 30px;
-        }}
-        
-        .contract-info-content.expanded {{
-            max-height: 1000px;
-            padding: 0 30px 25px 30px;
-        }}
-        
-        .info-item {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 10px 0;
-            border-bottom: 1px solid #9CA3AF;
-        }}
-        
-        .info-item:last-child {{
-            border-bottom: none;
-        }}
-        
-        .info-label {{
-            color: #9CA3AF;
-            font-weight: 500;
-            font-size: 14px;
-        }}
-        
-        .info-value {{
-            color: #F8F6FF;
-            font-family: 'Courier New', monospace;
-            font-size: 13px;
-            word-break: break-all;
-            text-align: right;
-            max-width: 60%;
-        }}
-        
-        .transaction-hash {{
-            color: #F8F6FF;
-            text-decoration: none;
-            font-family: 'Courier New', monospace;
-        }}
-        
-        .transaction-hash:hover {{
-            color: #9CA3AF;
-            text-decoration: underline;
-        }}
-        
-        .error-message {{
-            color: #9CA3AF;
-            font-style: italic;
-        }}
-        
-        .footer {{
-            padding: 20px 30px;
-            background: #0C0A1D;
-            color: #9CA3AF;
-            font-size: 14px;
-            margin-top: 0;
-        }}
-        
-        .footer-content {{
-            max-width: 1140px;
-            margin: 0 auto;
-        }}
-        
-        .footer-top {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 12px;
-            flex-wrap: wrap;
-            gap: 10px;
-        }}
-        
-        .footer-left {{
-            text-align: left;
-            flex: 0 0 auto;
-        }}
-        
-        .footer-right {{
-            text-align: right;
-            flex: 0 0 auto;
-        }}
-        
-        .footer a {{
-            color: #9CA3AF;
-            text-decoration: none;
-            transition: color 0.3s ease;
-        }}
-        
-        .footer a:hover {{
-            color: #F8F6FF;
-            text-decoration: underline;
-        }}
-        
-        .version {{
-            font-weight: 600;
-            color: #9CA3AF;
-        }}
-        
-        .footer-separator {{
-            color: #9CA3AF;
-        }}
-        
-        .github-icon {{
-            display: inline-block;
-            width: 16px;
-            height: 16px;
-            vertical-align: middle;
-            margin-right: 5px;
-        }}
-        
-        .bell-icon {{
-            fill: #F8F6FF;
-            width: 16px;
-            height: 16px;
-            vertical-align: middle;
-            margin-right: 5px;
-        }}
-        
-        @media (max-width: 768px) {{
-            .container {{
-                margin: 10px;
-                border-radius: 10px;
-            }}
-            
-            .header {{
-                padding: 20px;
-                flex-direction: column;
-                align-items: flex-start;
-                gap: 15px;
-            }}
-            
-            .title-container {{
-                gap: 10px;
-            }}
-            
-            .header-icon {{
-                width: 40px;
-                height: 40px;
-            }}
-            
-            .header h1 {{
-                font-size: 1.8em;
-            }}
-            
-            .search-container, .table-container {{
-                padding: 20px;
-            }}
-            
-            .footer-top {{
-                flex-direction: column;
-                align-items: flex-start;
-                gap: 12px;
-            }}
-            
-            .footer-left,
-            .footer-right {{
-                text-align: left;
-                width: 100%;
-            }}
-            
-            .counters-section {{
-                flex-direction: column;
-                padding: 20px;
-            }}
-            
-            .stats {{
-                flex-direction: column;
-                gap: 10px;
-                text-align: center;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
+    write = out.write
+    write(_TEMPLATE_HEAD)
+    write(f"""    <div class="container">
         <div class="header">
             <div class="title-container">
                 <img src="grt.png" alt="GRT" class="header-icon">
                 <h1>Eligibility Dashboard</h1>
             </div>
             <div class="subtitle">Last Update: {current_time}</div>
-        </div>"""
+        </div>""")
     
     # Calculate counters
     total_indexers = len(all_indexers)
-    eligible_count = sum(1 for indexer in all_indexers if indexer.get("status") == "eligible")
-    grace_count = sum(1 for indexer in all_indexers if indexer.get("status") == "grace")
-    ineligible_count = sum(1 for indexer in all_indexers if indexer.get("status") == "ineligible")
+    total_indexers_str = str(total_indexers)
+    status_counts = Counter(indexer.get("status") for indexer in all_indexers)
+    eligible_count = status_counts["eligible"]
+    grace_count = status_counts["grace"]
+    ineligible_count = status_counts["ineligible"]
     
-    html_content += f"""
+    write(f"""
         
         <div class="gip-banner">
             This dashboard is based on the <a href="https://forum.thegraph.com/t/gip-0079-indexer-rewards-eligibility-oracle/6734" target="_blank">GIP-0079: Indexer Rewards Eligibility Oracle</a>
@@ -1864,15 +1816,15 @@ def generate_html_dashboard(indexers: List[Tuple[str, str]], contract_address: s
             </div>
             <div class="filter-wrapper">
                 <span class="filter-label">Filter by Status:</span>
-                <button class="filter-btn eligible" onclick="filterByStatus('eligible')" data-tooltip="Indexers that are eligible for rewards">eligible</button>"""
+                <button class="filter-btn eligible" onclick="filterByStatus('eligible')" data-tooltip="Indexers that are eligible for rewards">eligible</button>""")
     
     # Add grace period tooltip if eligibility_period is available
     grace_tooltip = ""
-    if eligibility_period:
+    if eligibility_period is not None:
         days = int(eligibility_period / 86400)
         grace_tooltip = f' data-tooltip="Grace period is {days} days"'
     
-    html_content += f"""
+    write(f"""
                 <button class="filter-btn grace" onclick="filterByStatus('grace')"{grace_tooltip}>grace</button>
                 <button class="filter-btn ineligible" onclick="filterByStatus('ineligible')" data-tooltip="Indexers that are NOT eligible for rewards">ineligible</button>
                 <button class="filter-btn reset" onclick="resetFilter()" data-tooltip="Show All">Reset</button>
@@ -1890,7 +1842,7 @@ def generate_html_dashboard(indexers: List[Tuple[str, str]], contract_address: s
                     </tr>
                 </thead>
                 <tbody id="tableBody">
-"""
+""")
 
     # Sort indexers: first by status (eligible, grace, ineligible), then by ENS name
     def sort_key(indexer):
@@ -1902,275 +1854,40 @@ def generate_html_dashboard(indexers: List[Tuple[str, str]], contract_address: s
     
     all_indexers_sorted = sorted(all_indexers, key=sort_key)
 
-    # Add table rows from sorted indexers
-    for i, indexer in enumerate(all_indexers_sorted, 1):
-        address = indexer.get("address", "")
-        ens_name = indexer.get("ens_name", "")
-        is_eligible = indexer.get("is_eligible", False)
-        ens_display = ens_name if ens_name else "No ENS"
-        ens_class = "ens-name" if ens_name else "empty-ens"
-        explorer_url = f"https://thegraph.com/explorer/profile/{address}?view=Indexing&chain=arbitrum-one"
-        
-        # Set status badge based on eligibility
-        if is_eligible:
-            status_badge = '<span class="legend-badge good">eligible</span>'
-        else:
-            status_badge = '<span class="legend-badge ineligible">ineligible</span>'
-        
-        html_content += f"""                    <tr>
-                        <td><a href="{explorer_url}" target="_blank" class="address-link"><span class="address">{address}</span><svg class="external-link-icon" viewBox="0 0 16 16" fill="currentColor"><path d="M14 2.5a.5.5 0 0 0-.5-.5h-6a.5.5 0 0 0 0 1h4.793L8.146 7.146a.5.5 0 0 0 .708.708L13 3.707V8.5a.5.5 0 0 0 1 0v-6z"/><path d="M4.5 4a.5.5 0 0 0-.5.5v8a.5.5 0 0 0 .5.5h8a.5.5 0 0 0 .5-.5V9a.5.5 0 0 0-1 0v3H5V5h3a.5.5 0 0 0 0-1h-3.5z"/></svg></a></td>
-                        <td><span class="{ens_class}">{ens_display}</span></td>
-                        <td>{status_badge}</td>
-                        <td></td>
-                    </tr>
-"""
+    # Table data for the page script, which renders the rows client-side:
+    # [address, ENS, status, eligible until]
+    js_rows = [
+        (indexer.get("address", ""), indexer.get("ens_name", ""),
+         indexer.get("status", "ineligible"), indexer.get("eligible_until_readable", ""))
+        for indexer in all_indexers_sorted
+    ]
 
-    html_content += """                </tbody>
+    write("""                </tbody>
             </table>
         </div>
         
         <div class="stats">
-            <div class="total-count">Total Indexers: <span id="totalCount">""" + str(len(all_indexers)) + """</span></div>
-            <div class="filtered-count">Showing: <span id="filteredCount">""" + str(len(all_indexers)) + """</span></div>
+            <div class="total-count">Total Indexers: <span id="totalCount">""" + total_indexers_str + """</span></div>
+            <div class="filtered-count">Showing: <span id="filteredCount">""" + total_indexers_str + """</span></div>
         </div>
     </div>
 
+""" + _ROW_TEMPLATE + """
     <script>
-        // Table data
-        const originalData = [
-"""
-
-    # Sort indexers: first by status (eligible, grace, ineligible), then by ENS name
-    def sort_key(indexer):
-        status = indexer.get("status", "ineligible")
-        ens_name = indexer.get("ens_name", "")
-        # Status order: eligible (0), grace (1), ineligible (2), then by ENS (empty ENS last)
-        status_priority = {"eligible": 0, "grace": 1, "ineligible": 2}
-        return (status_priority.get(status, 3), ens_name.lower() if ens_name else "zzzzzzzzz")
-    
-    all_indexers_sorted = sorted(all_indexers, key=sort_key)
-
-    # Add JavaScript data from all indexers
-    for indexer in all_indexers_sorted:
-        address = indexer.get("address", "")
-        ens_name = indexer.get("ens_name", "")
-        status = indexer.get("status", "ineligible")
-        eligible_until_readable = indexer.get("eligible_until_readable", "")
-        
-        # Set status badge based on status
-        if status == "eligible":
-            status_badge = '<span class="legend-badge good">eligible</span>'
-        elif status == "grace":
-            status_badge = '<span class="legend-badge grace">grace</span>'
-        else:
-            status_badge = '<span class="legend-badge ineligible">ineligible</span>'
-        
-        html_content += f"""            ["{address}", "{ens_name}", '{status_badge}', "{eligible_until_readable}", "{status}"],
-"""
-
-    html_content += """        ];
-        
-        let currentData = [...originalData];
-        let sortColumn = -1;
-        let sortDirection = 'asc';
-        let activeFilter = null;
-        
-        // Search functionality
-        const searchInput = document.getElementById('searchInput');
-        const tableBody = document.getElementById('tableBody');
-        const totalCount = document.getElementById('totalCount');
-        const filteredCount = document.getElementById('filteredCount');
-        
-        // Apply both search and filter
-        function applyFilters() {
-            const searchTerm = searchInput.value.toLowerCase();
-            
-            currentData = originalData.filter(row => {
-                // Check search term
-                const matchesSearch = row[0].toLowerCase().includes(searchTerm) || 
-                                     row[1].toLowerCase().includes(searchTerm);
-                
-                // Check status filter (row[4] is the status string)
-                const matchesFilter = !activeFilter || row[4] === activeFilter;
-                
-                return matchesSearch && matchesFilter;
-            });
-            
-            renderTable();
-            updateStats();
-        }
-        
-        searchInput.addEventListener('input', applyFilters);
-        
-        // Filter by status functionality
-        function filterByStatus(status) {
-            // Toggle filter
-            if (activeFilter === status) {
-                activeFilter = null;
-                // Remove active class from all buttons
-                document.querySelectorAll('.filter-btn').forEach(btn => btn.classList.remove('active'));
-            } else {
-                activeFilter = status;
-                // Remove active class from all buttons
-                document.querySelectorAll('.filter-btn').forEach(btn => btn.classList.remove('active'));
-                // Add active class to clicked button
-                document.querySelector(`.filter-btn.${status}`).classList.add('active');
-            }
-            
-            applyFilters();
-        }
-        
-        // Reset filter
-        function resetFilter() {
-            activeFilter = null;
-            searchInput.value = '';
-            // Remove active class from all buttons
-            document.querySelectorAll('.filter-btn').forEach(btn => btn.classList.remove('active'));
-            applyFilters();
-        }
-        
-        // Sorting functionality
-        function sortTable(column) {
-            if (sortColumn === column) {
-                sortDirection = sortDirection === 'asc' ? 'desc' : 'asc';
-            } else {
-                sortColumn = column;
-                sortDirection = 'asc';
-            }
-            
-            // Special handling when sorting by ENS name column (index 1)
-            if (column === 1) {
-                // Separate rows with ENS from rows without ENS
-                const withENS = [];
-                const withoutENS = [];
-                
-                currentData.forEach(row => {
-                    const ens = row[1].toLowerCase();
-                    if (ens === '' || ens === 'no ens') {
-                        withoutENS.push(row);
-                    } else {
-                        withENS.push(row);
-                    }
-                });
-                
-                // Sort only the rows with ENS
-                withENS.sort((a, b) => {
-                    const aENS = a[1].toLowerCase();
-                    const bENS = b[1].toLowerCase();
-                    
-                    if (aENS < bENS) return sortDirection === 'asc' ? -1 : 1;
-                    if (aENS > bENS) return sortDirection === 'asc' ? 1 : -1;
-                    return 0;
-                });
-                
-                // Combine: sorted ENS rows + unsorted no-ENS rows at the end
-                if (sortDirection === 'asc') {
-                    currentData = [...withENS, ...withoutENS];
-                } else {
-                    // In descending order, put no-ENS at beginning
-                    currentData = [...withoutENS, ...withENS];
-                }
-                
-                renderTable();
-                updateSortHeaders();
-                return;
-            }
-            
-            // For all other columns, use regular sort
-            currentData.sort((a, b) => {
-                // Special handling when sorting by status column (index 2)
-                if (column === 2) {
-                    // Use the plain text status (row[4]) for sorting
-                    const aStatus = a[4].toLowerCase();
-                    const bStatus = b[4].toLowerCase();
-                    
-                    if (aStatus < bStatus) return sortDirection === 'asc' ? -1 : 1;
-                    if (aStatus > bStatus) return sortDirection === 'asc' ? 1 : -1;
-                    return 0;
-                }
-                
-                // For other columns, always maintain status priority first
-                // Status order: eligible (0), grace (1), ineligible (2)
-                const getStatusPriority = (statusString) => {
-                    if (statusString === 'eligible') return 0;
-                    if (statusString === 'grace') return 1;
-                    if (statusString === 'ineligible') return 2;
-                    return 3;
-                };
-                
-                const aStatusPriority = getStatusPriority(a[4]);
-                const bStatusPriority = getStatusPriority(b[4]);
-                
-                // If status priority differs, sort by priority
-                if (aStatusPriority !== bStatusPriority) {
-                    return aStatusPriority - bStatusPriority;
-                }
-                
-                // Within same status group, sort by the selected column
-                let aVal = a[column];
-                let bVal = b[column];
-                
-                // All columns are now text, so convert to lowercase for comparison
-                aVal = aVal.toLowerCase();
-                bVal = bVal.toLowerCase();
-                
-                if (aVal < bVal) return sortDirection === 'asc' ? -1 : 1;
-                if (aVal > bVal) return sortDirection === 'asc' ? 1 : -1;
-                return 0;
-            });
-            
-            renderTable();
-            updateSortHeaders();
-        }
-        
-        function renderTable() {
-            tableBody.innerHTML = '';
-            currentData.forEach((row, index) => {
-                const [address, ensName, status, eligibleUntil, statusString] = row;
-                const ensDisplay = ensName || 'No ENS';
-                const ensClass = ensName ? 'ens-name' : 'empty-ens';
-                const explorerUrl = `https://thegraph.com/explorer/profile/${address}?view=Indexing&chain=arbitrum-one`;
-                
-                const rowHTML = `
-                    <tr>
-                        <td><a href="${explorerUrl}" target="_blank" class="address-link"><span class="address">${address}</span></a></td>
-                        <td><span class="${ensClass}">${ensDisplay}</span></td>
-                        <td>${status}</td>
-                        <td>${eligibleUntil}</td>
-                    </tr>
-                `;
-                tableBody.innerHTML += rowHTML;
-            });
-        }
+        const VIRTUALIZE = """ + ('true' if total_indexers > VIRTUAL_SCROLL_THRESHOLD else 'false') + """;
         
-        function updateSortHeaders() {
-            const headers = document.querySelectorAll('th.sortable');
-            headers.forEach((header, index) => {
-                header.className = 'sortable';
-                if (index === sortColumn) {
-                    header.classList.add(sortDirection === 'asc' ? 'sort-asc' : 'sort-desc');
-                }
-            });
-        }
-        
-        function updateStats() {
-            totalCount.textContent = originalData.length;
-            filteredCount.textContent = currentData.length;
-        }
-        
-        // Add click handlers to sortable headers
-        document.querySelectorAll('th.sortable').forEach((header, index) => {
-            header.addEventListener('click', () => sortTable(index));
-        });
-        
-        // Initialize
-        renderTable();
-        updateStats();
+        // Table data: [address, ENS, status, eligible until]
+        const originalData = JSON.parse('""")
+    
+    # Serialize all rows with one json.dumps call and hand the text to JSON.parse,
+    # which browsers parse considerably faster than the same data as a JS literal
+    write(json.dumps(js_rows, separators=(',', ':')).translate(_SCRIPT_JSON_TRANS))
+    write("""');
     </script>
-"""
+    """ + _SCRIPT_TAG + "\n")
     
     # Add legend section before footer (commented out - using filter section instead)
-    # html_content += """
+    # write("""
     # <div class="legend">
     #     <div class="legend-title">Status Legend</div>
     #     <div class="legend-items">
@@ -2188,30 +1905,13 @@ def generate_html_dashboard(indexers: List[Tuple[str, str]], contract_address: s
     #         </div>
     #     </div>
     # </div>
-    # """
+    # """)
     
     # Add footer with version, GitHub link, and Telegram bot
-    html_content += f"""    
-    <div class="footer">
-        <div class="footer-content">
-            <div class="footer-top">
-                <div class="footer-left">
-                    <svg class="bell-icon" viewBox="0 0 24 24" fill="currentColor"><path d="M12 22c1.1 0 2-.9 2-2h-4c0 1.1.9 2 2 2zm6-6v-5c0-3.07-1.63-5.64-4.5-6.32V4c0-.83-.67-1.5-1.5-1.5s-1.5.67-1.5 1.5v.68C7.64 5.36 6 7.92 6 11v5l-2 2v1h16v-1l-2-2zm-2 1H8v-6c0-2.48 1.51-4.5 4-4.5s4 2.02 4 4.5v6z"/></svg><a href="https://t.me/reo_dashboard_bot" target="_blank">Subscribe to real-time notifications on Telegram</a>
-                </div>
-                <div class="footer-right">
-                    <span class="version">v{VERSION}</span>
-                    <span class="footer-separator">-</span>
-                    <svg class="github-icon" viewBox="0 0 16 16" fill="currentColor"><path d="M8 0C3.58 0 0 3.58 0 8c0 3.54 2.29 6.53 5.47 7.59.4.07.55-.17.55-.38 0-.19-.01-.82-.01-1.49-2.01.37-2.53-.49-2.69-.94-.09-.23-.48-.94-.82-1.13-.28-.15-.68-.52-.01-.53.63-.01 1.08.58 1.23.82.72 1.21 1.87.87 2.33.66.07-.52.28-.87.51-1.07-1.78-.2-3.64-.89-3.64-3.95 0-.87.31-1.59.82-2.15-.08-.2-.36-1.02.08-2.12 0 0 .67-.21 2.2.82.64-.18 1.32-.27 2-.27.68 0 1.36.09 2 .27 1.53-1.04 2.2-.82 2.2-.82.44 1.1.16 1.92.08 2.12.51.56.82 1.27.82 2.15 0 3.07-1.87 3.75-3.65 3.95.29.25.54.73.54 1.48 0 1.07-.01 1.93-.01 2.2 0 .21.15.46.55.38A8.013 8.013 0 0016 8c0-4.42-3.58-8-8-8z"/></svg><a href="https://github.com/pdiomede/reo-dashboard" target="_blank">View repo on GitHub</a>
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <!-- Contract Information Section - Commented out as requested -->
-    """
+    write(_TEMPLATE_FOOTER)
     
     # Contract Information Section - Commented out as requested
-    # html_content += f"""
+    # write(f"""
     # <div class="contract-info">
     #     <div class="contract-info-header" onclick="toggleContractInfo()">
     #         <h3>Contract Information (FOR DEBUG ONLY - will be removed in the future)</h3>
@@ -2223,37 +1923,37 @@ def generate_html_dashboard(indexers: List[Tuple[str, str]], contract_address: s
     #         <div class="info-item">
     #             <span class="info-label">Sepolia Contract on Arbitrum:</span>
     #             <span class="info-value"><a href="https://sepolia.arbiscan.io/address/{contract_address}" target="_blank" class="transaction-hash">{contract_address}</a></span>
-    #         </div>"""
+    #         </div>""")
     # 
     # # Add oracle update time
-    # if oracle_update_time:
+    # if oracle_update_time is not None:
     #     try:
     #         oracle_readable_time = datetime.fromtimestamp(oracle_update_time, tz=timezone.utc).strftime("%d %b %Y at %H:%M:%S (UTC)")
-    #         html_content += f"""
+    #         write(f"""
     #     <div class="info-item">
     #         <span class="info-label">Last Oracle Update Time:</span>
     #         <span class="info-value">{oracle_readable_time}</span>
-    #     </div>"""
+    #     </div>""")
     #     except Exception as e:
     #         print(f"Error formatting oracle update time: {e}")
-    #         html_content += """
+    #         write("""
     #     <div class="info-item">
     #         <span class="info-label">Last Oracle Update Time:</span>
     #         <span class="info-value"><span class="error-message">Error formatting oracle update time</span></span>
-    #     </div>"""
+    #     </div>""")
     # else:
-    #     html_content += """
+    #     write("""
     #     <div class="info-item">
     #         <span class="info-label">Last Oracle Update Time:</span>
     #         <span class="info-value"><span class="error-message">Unable to fetch oracle update time</span></span>
-    #     </div>"""
+    #     </div>""")
     # 
     # # Add last transaction data (without transaction time)
     # if last_transaction:
     #     tx_hash = last_transaction.get('hash', 'N/A')
     #     block_number = last_transaction.get('blockNumber', 'N/A')
     #     
-    #     html_content += f"""
+    #     write(f"""
     #     <div class="info-item">
     #         <span class="info-label">Last Transaction ID:</span>
     #         <span class="info-value"><a href="https://sepolia.arbiscan.io/tx/{tx_hash}" target="_blank" class="transaction-hash">{tx_hash}</a></span>
@@ -2261,31 +1961,31 @@ def generate_html_dashboard(indexers: List[Tuple[str, str]], contract_address: s
     #     <div class="info-item">
     #         <span class="info-label">Block Number:</span>
     #         <span class="info-value">{block_number}</span>
-    #     </div>"""
+    #     </div>""")
     # else:
-    #     html_content += """
+    #     write("""
     #     <div class="info-item">
     #         <span class="info-label">Last Transaction ID:</span>
     #         <span class="info-value"><span class="error-message">Unable to fetch transaction data</span></span>
-    #     </div>"""
+    #     </div>""")
     # 
     # # Add eligibility period
-    # if eligibility_period:
+    # if eligibility_period is not None:
     #     # Convert seconds to days
     #     days = eligibility_period / 86400
-    #     html_content += f"""
+    #     write(f"""
     #     <div class="info-item">
     #         <span class="info-label">Eligibility Period:</span>
     #         <span class="info-value">{eligibility_period} seconds ({days:.1f} days)</span>
-    #     </div>"""
+    #     </div>""")
     # else:
-    #     html_content += """
+    #     write("""
     #     <div class="info-item">
     #         <span class="info-label">Eligibility Period:</span>
     #         <span class="info-value"><span class="error-message">Unable to fetch eligibility period</span></span>
-    #     </div>"""
+    #     </div>""")
     # 
-    # html_content += """
+    # write("""
     #     </div>
     # </div>
     # 
@@ -2297,13 +1997,27 @@ def generate_html_dashboard(indexers: List[Tuple[str, str]], contract_address: s
     #         arrow.classList.toggle('expanded');
     #     }
     # </script>
-    # """
+    # """)
     
-    html_content += """
-</body>
-</html>"""
+    write(_TEMPLATE_TAIL)
 
-    return html_content
+
+def generate_html_dashboard(indexers: List[Tuple[str, str]], contract_address: str, api_key: Optional[str] = None, quicknode_url: Optional[str] = None) -> str:
+    """
+    Generate the HTML dashboard content.
+    
+    Args:
+        indexers: List of (address, ens_name) tuples (legacy parameter, not used)
+        contract_address: The Sepolia contract address
+        api_key: Arbiscan API key
+        quicknode_url: QuickNode RPC endpoint URL
+        
+    Returns:
+        Complete HTML content as string
+    """
+    buffer = io.StringIO()
+    stream_html_dashboard(indexers, buffer, contract_address=contract_address, api_key=api_key, quicknode_url=quicknode_url)
+    return buffer.getvalue()
 
 
 def main():
@@ -2323,6 +2037,12 @@ def main():
         print("    2. Edit .env with your API keys")
         print()
     
+    # REFRESH_CACHE=1 forces the cached eligibility period and renewal times to be fetched again
+    if os.getenv("REFRESH_CACHE") == "1":
+        print("✓ REFRESH_CACHE=1: dropping cached eligibility period and renewal times")
+        invalidate_cached('eligibility_period')
+        invalidate_cached('renewal_times')
+    
     # Load environment variables (no hardcoded fallbacks)
     graph_api_key = os.getenv("GRAPH_API_KEY")
     use_cached_ens = os.getenv("USE_CACHED_ENS", "N").upper() == "Y"
@@ -2330,7 +2050,15 @@ def main():
     api_key = os.getenv("ARBISCAN_API_KEY")
     quicknode_url = os.getenv("QUICK_NODE")
     
-    # Retrieve active indexers by querying network subgraph
+    try:
+        rpc_batch_size = max(1, int(os.getenv("RPC_BATCH_SIZE", RPC_BATCH_SIZE)))
+    except ValueError:
+        print(f"⚠ RPC_BATCH_SIZE is not a number, using {RPC_BATCH_SIZE}")
+        rpc_batch_size = RPC_BATCH_SIZE
+    
+    # Retrieve active indexers by querying network subgraph; the returned data is handed
+    # to checkEligibility so it doesn't have to read back the file just written
+    active_indexers_data = None
     if graph_api_key and graph_api_key != "your_graph_api_key_here":
         print()
         print("=" * 60)
@@ -2339,10 +2067,10 @@ def main():
             print("   Using cached ENS data from ens_resolution.json")
         else:
             print("🌐 ENS Cache Mode: DISABLED")
-            print("   Fetching fresh ENS data from subgraph")
+            print(f"   Fetching ENS names from subgraph (names looked up in the last {ENS_CACHE_TTL // 86400} days are reused)")
         print("=" * 60)
         print()
-        retrieveActiveIndexers(graph_api_key, use_cached_ens=use_cached_ens, contract_address=contract_address, quicknode_url=quicknode_url)
+        active_indexers_data = retrieveActiveIndexers(graph_api_key, use_cached_ens=use_cached_ens, contract_address=contract_address, quicknode_url=quicknode_url)
         print()
     else:
         print("⚠ GRAPH_API_KEY not set, skipping active indexers retrieval")
@@ -2379,7 +2107,7 @@ def main():
     print()
     
     # Check eligibility for each indexer by calling the contract
-    checkEligibility(contract_address, quicknode_url)
+    checkEligibility(contract_address, quicknode_url, batch_size=rpc_batch_size, data=active_indexers_data)
     print()
     
     # Update status change dates by comparing with previous run
@@ -2403,11 +2131,29 @@ def main():
         print("ℹ️ Telegram notifications disabled (module not available)")
         print()
     
-    html_content = generate_html_dashboard(indexers, contract_address=contract_address, api_key=api_key, quicknode_url=quicknode_url)
+    # Reuse the oracle update time and eligibility period retrieveActiveIndexers read
+    # this run instead of asking the contract again
+    contract_parameters = None
+    if active_indexers_data:
+        metadata = active_indexers_data.get("metadata", {})
+        contract_parameters = (metadata.get("last_oracle_update_time"), metadata.get("eligibility_period"))
+    
+    # Stream the dashboard into a temporary file and rename it over index.html once it
+    # is complete, so the published page is never empty or truncated while the page
+    # data is fetched or if generation fails; the 1 MiB buffer keeps the number of
+    # write() calls low without building the whole page in memory
+    with open('index.html.tmp', 'w', encoding='utf-8', buffering=1 << 20) as file:
+        stream_html_dashboard(indexers, file, contract_address=contract_address, api_key=api_key, quicknode_url=quicknode_url,
+                              contract_parameters=contract_parameters)
+    os.replace('index.html.tmp', 'index.html')
     
-    # Write to index.html
-    with open('index.html', 'w', encoding='utf-8') as file:
-        file.write(html_content)
+    # Pre-compressed copy for servers that can hand out index.html.gz directly
+    # (e.g. nginx gzip_static); the repetitive table data shrinks 10x or more.
+    # It is compressed once per run and served many times, so use the best level.
+    with open('index.html', 'rb') as src, open('index.html.gz.tmp', 'wb') as raw, \
+            gzip.GzipFile('index.html', 'wb', compresslevel=9, fileobj=raw) as dst:
+        shutil.copyfileobj(src, dst, 1 << 20)
+    os.replace('index.html.gz.tmp', 'index.html.gz')
     
     print("Dashboard generated successfully!")
     print("Open 'index.html' in your browser to view the dashboard.")